@@ -0,0 +1,220 @@
+"""Shared build-script generation for the Speech2Text build scripts.
+
+Single source of truth for the package and exclude lists that the
+PyInstaller and cx_Freeze builders previously each hardcoded in their own
+embedded templates. Each builder requests only the package set it needs,
+which keeps the dependency graph the freezer has to analyze minimal.
+"""
+
+# Third-party packages the application imports at runtime
+CORE_PACKAGES = ("openai", "pyaudio", "numpy", "pynput")
+
+# tkinter and the submodules pulled in lazily by the UI code
+GUI_PACKAGES = ("tkinter", "tkinter.ttk", "tkinter.messagebox", "tkinter.filedialog")
+
+# Encrypted settings storage
+CRYPTO_PACKAGES = ("cryptography",)
+
+# Stdlib modules cx_Freeze wants listed explicitly under its 'packages'
+# option; PyInstaller's modulegraph discovers these on its own
+STDLIB_AUTOPKG = (
+    "threading", "tempfile", "wave", "json", "base64", "hashlib",
+    "pathlib", "ctypes", "platform", "time", "datetime", "math", "os", "sys"
+)
+
+# Heavy packages neither builder should ever pull in, including packaging
+# tooling that leaks into the graph when building from a shared interpreter
+EXCLUDES = (
+    "matplotlib", "scipy", "pandas", "IPython", "jupyter",
+    "test", "tests", "unittest", "email.test", "tkinter.test", "sqlite3.test",
+    "pydoc", "lib2to3", "xmlrpc", "distutils",
+    "setuptools", "pip", "wheel", "botocore", "boto3"
+)
+
+# Extra trims that are safe for the frozen app but only supported cleanly
+# by cx_Freeze's exclude handling
+CXFREEZE_EXTRA_EXCLUDES = ("email", "html", "http", "urllib", "xml")
+
+
+def _fmt(names, indent=8):
+    """Format a name sequence as an indented source-code list body."""
+    pad = " " * indent
+    return ",\n".join(f"{pad}'{name}'" for name in names)
+
+
+_PYINSTALLER_TEMPLATE = '''# -*- mode: python ; coding: utf-8 -*-
+
+block_cipher = None
+
+a = Analysis(
+    ['launcher.py'],
+    pathex=['.', 'src', 'src/speech2text'],
+    binaries=[],
+    datas=[
+        ('src/speech2text/*.py', 'speech2text'),
+    ],
+    hiddenimports=[
+        # Only true dynamic imports - everything imported directly in the
+        # source is auto-discovered by PyInstaller's modulegraph
+        'cryptography.fernet',
+        'pynput.keyboard',
+        'pynput.mouse',
+        'speech2text',
+        'speech2text.modern_speech_app',
+        'speech2text.settings',
+        'speech2text.theme',
+        'speech2text.audio_monitor',
+        'speech2text.global_hotkey',
+        'speech2text.animations',
+        'speech2text.modern_settings_dialog'
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[
+%(excludes)s
+    ],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+    optimize=%(optimize)d,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='Speech2Text',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,  # UPX-packed DLLs must decompress at every launch and trigger AV rescans
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,  # Set to False for GUI app (no console window)
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=None,  # Add path to .ico file if you have one
+    version_info={
+        'version': '0.1.0',
+        'description': 'Modern Speech-to-Text Application',
+        'product_name': 'Speech2Text',
+        'file_description': 'Speech2Text - Modern Desktop Application',
+        'company_name': 'Speech2Text Contributors',
+        'copyright': '(C) 2025 Speech2Text Contributors'
+    }
+)
+'''
+
+
+_CXFREEZE_TEMPLATE = '''"""Setup script for creating MSI installer with cx_Freeze (generated)."""
+
+import sys
+from cx_Freeze import setup, Executable
+from pathlib import Path
+
+# Version
+version = "0.1.0"
+
+# Include files and directories
+include_files = %(include_files)s
+
+# Build options
+build_exe_options = {
+    "packages": [
+%(packages)s
+    ],
+    "excludes": [
+%(excludes)s
+    ],
+    "include_files": include_files,
+    "optimize": %(optimize)d,%(build_exe_dir)s
+}
+
+# Note: a persistent module-finder cache was tried here and removed.
+# cx_Freeze Module objects carry code objects, which pickle rejects,
+# and re-seeding module *names* through the finder's include API just
+# re-runs the per-module analysis that makes discovery slow in the
+# first place - so there is nothing useful to cache across runs.
+
+# MSI build options
+bdist_msi_options = {
+    "add_to_path": False,
+    "initial_target_dir": "[ProgramFilesFolder]\\\\Speech2Text",
+    "upgrade_code": "%(upgrade_code)s",%(summary_data)s
+}
+
+# Define executable
+executables = [
+    Executable(
+        script="launcher.py",
+        base="Win32GUI",
+        target_name="Speech2Text.exe",%(shortcut)s
+    )
+]
+
+# Setup configuration
+setup(
+    name="Speech2Text",
+    version=version,
+    description="Modern Speech-to-Text Desktop Application",
+    author="Speech2Text Contributors",
+    executables=executables,
+    options={
+        "build_exe": build_exe_options,
+        "bdist_msi": bdist_msi_options
+    }
+)
+'''
+
+
+def generate_build_script(kind='pyinstaller', profile='min', optimize=2):
+    """Generate a freezer script from the shared package lists.
+
+    Args:
+        kind: 'pyinstaller' for a .spec file, 'cxfreeze' for a setup script
+        profile: 'min' for the lean build, 'full' to include source files,
+            shortcuts, and installer metadata (cx_Freeze only)
+        optimize: Bytecode optimization level for collected modules
+
+    Returns:
+        The generated script content as a string
+    """
+    if kind == 'pyinstaller':
+        return _PYINSTALLER_TEMPLATE % {
+            'excludes': _fmt(EXCLUDES),
+            'optimize': optimize,
+        }
+
+    if kind != 'cxfreeze':
+        raise ValueError(f"Unknown build script kind: {kind!r}")
+
+    full = profile == 'full'
+    return _CXFREEZE_TEMPLATE % {
+        'include_files': ('[\n    ("src/speech2text/", "lib/speech2text/"),\n]'
+                          if full else '[]'),
+        'packages': _fmt(GUI_PACKAGES + CORE_PACKAGES + CRYPTO_PACKAGES + STDLIB_AUTOPKG),
+        'excludes': _fmt(EXCLUDES + CXFREEZE_EXTRA_EXCLUDES),
+        'optimize': optimize,
+        'build_exe_dir': ('\n    "build_exe": "build/exe.win-amd64-3.13",' if full else ''),
+        'upgrade_code': ('{12345678-1234-1234-1234-123456789012}' if full
+                         else '{A1B2C3D4-E5F6-7890-ABCD-EF1234567890}'),
+        'summary_data': ('''
+    "summary_data": {
+        "author": "Speech2Text Contributors",
+        "comments": "Modern Speech-to-Text Desktop Application",
+        "keywords": "speech-to-text, transcription, openai, whisper, voice"
+    },''' if full else ''),
+        'shortcut': ('''
+        shortcut_name="Speech2Text",
+        shortcut_dir="DesktopFolder",''' if full else ''),
+    }
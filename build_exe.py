@@ -1,124 +1,93 @@
 """Build script to create a standalone .exe file for Speech2Text application."""
+import hashlib
 import subprocess
 import sys
 import os
 from pathlib import Path
 
-def create_spec_file():
-    """Create PyInstaller spec file with proper configuration."""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['launcher.py'],
-    pathex=['.', 'src', 'src/speech2text'],
-    binaries=[],
-    datas=[
-        ('src/speech2text/*.py', 'speech2text'),
-    ],
-    hiddenimports=[
-        'tkinter',
-        'tkinter.ttk', 
-        'tkinter.scrolledtext',
-        'tkinter.messagebox',
-        'tkinter.filedialog',
-        'openai',
-        'pyaudio',
-        'cryptography',
-        'cryptography.fernet',
-        'numpy',
-        'pynput',
-        'pynput.keyboard',
-        'pynput.mouse',
-        'threading',
-        'tempfile',
-        'wave',
-        'json',
-        'base64',
-        'hashlib',
-        'pathlib',
-        'ctypes',
-        'ctypes.wintypes',
-        'platform',
-        'time',
-        'datetime',
-        'math',
-        'os',
-        'sys',
-        'speech2text',
-        'speech2text.modern_speech_app',
-        'speech2text.settings',
-        'speech2text.theme',
-        'speech2text.audio_monitor', 
-        'speech2text.global_hotkey',
-        'speech2text.animations',
-        'speech2text.modern_settings_dialog'
-    ],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='Speech2Text',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,  # Set to False for GUI app (no console window)
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=None,  # Add path to .ico file if you have one
-    version_info={
-        'version': '0.1.0',
-        'description': 'Modern Speech-to-Text Application',
-        'product_name': 'Speech2Text',
-        'file_description': 'Speech2Text - Modern Desktop Application',
-        'company_name': 'Speech2Text Contributors',
-        'copyright': '(C) 2025 Speech2Text Contributors'
-    }
-)
-'''
-    
+from build_config import generate_build_script
+
+BUILD_HASH_FILE = Path('dist/.build_hash')
+
+# Suppress console flashes and raise scheduler priority for build
+# subprocesses on Windows; a no-op elsewhere
+_WIN_FLAGS = 0x08000080 if sys.platform == 'win32' else 0  # CREATE_NO_WINDOW | HIGH_PRIORITY_CLASS
+
+def compute_source_hash(spec_content):
+    """Hash all build inputs so unchanged sources can skip the rebuild.
+
+    Args:
+        spec_content: The generated spec file content (part of the inputs)
+
+    Returns:
+        Hex digest covering launcher.py, the application sources, and the spec
+    """
+    hasher = hashlib.blake2b(usedforsecurity=False)
+    sources = [Path('launcher.py')] + sorted(Path('src/speech2text').glob('**/*.py'))
+    for source in sources:
+        hasher.update(str(source).encode())
+        hasher.update(source.read_bytes())
+    hasher.update(spec_content.encode())
+    return hasher.hexdigest()
+
+def create_spec_file(optimize=2):
+    """Create PyInstaller spec file with proper configuration.
+
+    Args:
+        optimize: Bytecode optimization level for collected modules.
+            Level 2 strips docstrings and asserts, shrinking the PYZ and
+            speeding up archive extraction at launch.
+    """
+    spec_content = generate_build_script('pyinstaller', optimize=optimize)
+
     with open('speech2text.spec', 'w') as f:
         f.write(spec_content)
     print("[OK] Created speech2text.spec file")
 
-def build_exe():
+def build_exe(optimize=2):
     """Build the executable using PyInstaller."""
     print("[BUILD] Building executable with PyInstaller...")
-    
+
+    # Skip the whole PyInstaller pipeline when nothing changed since the
+    # last successful build
+    spec_content = generate_build_script('pyinstaller', optimize=optimize)
+    source_hash = compute_source_hash(spec_content)
+    if (Path('dist/Speech2Text.exe').exists() and
+            BUILD_HASH_FILE.exists() and
+            BUILD_HASH_FILE.read_text().strip() == source_hash):
+        print("[SKIP] dist/Speech2Text.exe is up-to-date")
+        return True
+
     # Create spec file
-    create_spec_file()
-    
-    # Run PyInstaller
+    create_spec_file(optimize=optimize)
+
+    # Run PyInstaller in-process - spawning `python -m PyInstaller` pays a
+    # full interpreter cold start plus a re-import of PyInstaller's module
+    # tree on every build; calling its entry point directly skips both.
+    # No --clean: PyInstaller's own build/ cache makes incremental runs
+    # much cheaper than a from-scratch dependency-graph scan
+    pyi_args = ['--noconfirm', 'speech2text.spec']
     try:
-        result = subprocess.run([
-            sys.executable, '-m', 'PyInstaller', 
-            '--clean',
-            'speech2text.spec'
-        ], check=True, capture_output=True, text=True)
-        
+        try:
+            from PyInstaller.__main__ import run as pyi_run
+        except ImportError:
+            # PyInstaller not importable from this interpreter - fall back
+            # to the isolated subprocess, streaming its multi-megabyte log
+            # to disk; only stderr (small) is captured
+            with open('build.log', 'wb') as log_f:
+                subprocess.run([
+                    sys.executable, '-m', 'PyInstaller', *pyi_args
+                ], check=True, stdout=log_f, stderr=subprocess.PIPE,
+                    creationflags=_WIN_FLAGS)
+        else:
+            try:
+                pyi_run(pyi_args)
+            except SystemExit as e:
+                if e.code:
+                    raise RuntimeError(f"PyInstaller exited with status {e.code}")
+
         print("[SUCCESS] Build completed successfully!")
+        BUILD_HASH_FILE.write_text(source_hash)
         print(f"[LOCATION] Executable created at: {Path.cwd() / 'dist' / 'Speech2Text.exe'}")
         
         # Show file size
@@ -129,9 +98,15 @@ def build_exe():
         
         return True
         
+    except RuntimeError as e:
+        print(f"[ERROR] Build failed!")
+        print(f"Error: {e}")
+        return False
+
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Build failed!")
-        print(f"Error: {e.stderr}")
+        print(f"Error: {e.stderr.decode('utf-8', errors='replace')}")
+        print("[LOG] Full PyInstaller output saved to build.log")
         return False
 
 def main():
@@ -139,13 +114,24 @@ def main():
     print("[START] Building Speech2Text executable...")
     print(f"[DIR] Working directory: {Path.cwd()}")
     
-    # Check if we're in the right directory
-    if not Path('src/speech2text/main.py').exists():
+    # Check if we're in the right directory - one stat syscall, no pathlib
+    # object churn
+    try:
+        os.stat('src/speech2text/main.py')
+    except FileNotFoundError:
         print("[ERROR] main.py not found. Make sure you're in the project root directory.")
         return
-    
-    # Build the executable
-    success = build_exe()
+
+    # Require a virtual environment - a shared interpreter drags every
+    # globally installed package into the dependency graph and the bundle
+    if sys.prefix == sys.base_prefix:
+        print("[ERROR] Not running inside a virtual environment.")
+        print("Create one with 'uv venv' and install dependencies before building.")
+        return
+
+    # Build the executable (--no-optimize keeps docstrings for debugging)
+    optimize = 0 if '--no-optimize' in sys.argv else 2
+    success = build_exe(optimize=optimize)
     
     if success:
         print("\n[COMPLETE] Build completed successfully!")
@@ -3,69 +3,19 @@
 import sys
 import os
 import subprocess
+import importlib.metadata
 from pathlib import Path
-import shutil
 
-def create_fixed_setup_py():
-    """Create a working setup.py file for cx_Freeze MSI build."""
-    setup_content = '''"""Working setup script for creating MSI installer with cx_Freeze."""
-
-import sys
-from cx_Freeze import setup, Executable
-from pathlib import Path
-
-# Version
-version = "0.1.0"
+from build_config import generate_build_script
+from build_msi import _probe_cached, _probe_store, remove_dir_async
 
-# Include files - just the essential ones
-include_files = []
+# Suppress console flashes and raise scheduler priority for build
+# subprocesses on Windows; a no-op elsewhere
+_WIN_FLAGS = 0x08000080 if sys.platform == 'win32' else 0  # CREATE_NO_WINDOW | HIGH_PRIORITY_CLASS
 
-# Build options - simplified and compatible
-build_exe_options = {
-    "packages": [
-        "tkinter", "tkinter.ttk", "tkinter.messagebox", "tkinter.filedialog",
-        "openai", "pyaudio", "cryptography", "numpy", "pynput",
-        "threading", "tempfile", "wave", "json", "base64", "hashlib",
-        "pathlib", "ctypes", "platform", "time", "datetime", "math", "os", "sys"
-    ],
-    "excludes": [
-        "matplotlib", "scipy", "pandas", "IPython", "jupyter",
-        "test", "unittest", "email", "html", "http", "urllib",
-        "xml", "xmlrpc", "distutils", "lib2to3", "pydoc"
-    ],
-    "include_files": include_files,
-    "optimize": 1,  # Use level 1 optimization instead of 2
-}
-
-# MSI build options - simplified
-bdist_msi_options = {
-    "add_to_path": False,
-    "initial_target_dir": "[ProgramFilesFolder]\\\\Speech2Text",
-    "upgrade_code": "{A1B2C3D4-E5F6-7890-ABCD-EF1234567890}",
-}
-
-# Define executable
-executables = [
-    Executable(
-        script="launcher.py",
-        base="Win32GUI",
-        target_name="Speech2Text.exe",
-    )
-]
-
-# Setup configuration
-setup(
-    name="Speech2Text",
-    version=version,
-    description="Modern Speech-to-Text Desktop Application",
-    author="Speech2Text Contributors",
-    executables=executables,
-    options={
-        "build_exe": build_exe_options,
-        "bdist_msi": bdist_msi_options
-    }
-)
-'''
+def create_fixed_setup_py():
+    """Create a working setup.py file for cx_Freeze MSI build."""
+    setup_content = generate_build_script('cxfreeze', profile='min', optimize=1)
     
     with open('setup_msi_fixed.py', 'w') as f:
         f.write(setup_content)
@@ -78,23 +28,26 @@ def build_msi_fixed():
     # Create fixed setup file
     create_fixed_setup_py()
     
-    # Clean previous builds
+    # Clean previous builds - deletion happens off the critical path
     if Path('build').exists():
-        shutil.rmtree('build')
-        print("[CLEAN] Removed previous build directory")
-    
+        remove_dir_async('build')
+        print("[CLEAN] Removing previous build directory in background")
+
     if Path('dist').exists():
-        shutil.rmtree('dist')
-        print("[CLEAN] Removed previous dist directory")
+        remove_dir_async('dist')
+        print("[CLEAN] Removing previous dist directory in background")
     
     try:
-        # Build the MSI directly
+        # Build the MSI directly - stream verbose stdout to a log file so
+        # the pipe never fills; only stderr (small) is captured
         print("[BUILDING] Creating MSI installer...")
-        result = subprocess.run([
-            sys.executable, 'setup_msi_fixed.py', 
-            'bdist_msi'
-        ], check=True, capture_output=True, text=True, cwd=Path.cwd())
-        
+        with open('build.log', 'wb') as log_f:
+            result = subprocess.run([
+                sys.executable, 'setup_msi_fixed.py',
+                'bdist_msi'
+            ], check=True, stdout=log_f, stderr=subprocess.PIPE, cwd=Path.cwd(),
+                creationflags=_WIN_FLAGS)
+
         print("[SUCCESS] MSI build completed successfully!")
         
         # Find and report MSI file
@@ -113,9 +66,8 @@ def build_msi_fixed():
         print(f"[ERROR] MSI build failed!")
         print(f"Return code: {e.returncode}")
         if e.stderr:
-            print(f"Error output: {e.stderr}")
-        if e.stdout:
-            print(f"Standard output: {e.stdout}")
+            print(f"Error output: {e.stderr.decode('utf-8', errors='replace')}")
+        print("[LOG] Full build output saved to build.log")
         return False
 
 def cleanup_temp_files():
@@ -134,28 +86,34 @@ def main():
     print("[START] Building Speech2Text MSI installer (Fixed Version)...")
     print(f"[DIR] Working directory: {Path.cwd()}")
     
-    # Check prerequisites
-    if not Path('src/speech2text/main.py').exists():
-        print("[ERROR] main.py not found. Make sure you're in the project root directory.")
-        return
-    
-    if not Path('launcher.py').exists():
-        print("[ERROR] launcher.py not found. Make sure launcher.py exists in the project root.")
-        return
-    
-    # Check cx_Freeze
-    try:
-        import cx_Freeze
-        print("[OK] cx_Freeze is available")
-    except ImportError:
-        print("[ERROR] cx_Freeze not found. Installing...")
+    # Check if we're in the right directory - one stat syscall per file,
+    # no pathlib object churn
+    for required in ('src/speech2text/main.py', 'launcher.py'):
         try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'cx_Freeze'], check=True)
-            print("[OK] cx_Freeze installed successfully")
-        except subprocess.CalledProcessError:
-            print("[ERROR] Failed to install cx_Freeze")
+            os.stat(required)
+        except FileNotFoundError:
+            print(f"[ERROR] {required} not found. Make sure you're in the project root directory.")
             return
     
+    # Check cx_Freeze - cached probe first, then package metadata
+    cached_version = _probe_cached("cx_Freeze")
+    if cached_version:
+        print(f"[OK] cx_Freeze {cached_version} is available (cached)")
+    else:
+        try:
+            version = importlib.metadata.version("cx_Freeze")
+            print(f"[OK] cx_Freeze {version} is available")
+            _probe_store("cx_Freeze", version)
+        except importlib.metadata.PackageNotFoundError:
+            print("[ERROR] cx_Freeze not found. Installing...")
+            try:
+                subprocess.run([sys.executable, '-m', 'pip', 'install', 'cx_Freeze'],
+                               check=True, creationflags=_WIN_FLAGS)
+                print("[OK] cx_Freeze installed successfully")
+            except subprocess.CalledProcessError:
+                print("[ERROR] Failed to install cx_Freeze")
+                return
+    
     # Build the MSI
     success = build_msi_fixed()
     
@@ -2,162 +2,206 @@
 
 import os
 import sys
-import uuid
-import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
-import tempfile
-import shutil
 
-def build_exe_first():
-    """Build the EXE file first using existing build script."""
-    print("[STEP 1/3] Building executable first...")
-    
+# subprocess and shutil are imported lazily inside the functions that need
+# them - the prerequisite-check failure paths exit without paying for them
+
+# WiX source fragments - compiled independently so candle can run them in
+# parallel while the EXE build is still in flight
+WIX_FRAGMENTS = ['product.wxs', 'registry.wxs', 'shortcuts.wxs']
+
+# WiX v3 source namespace
+WIX_NS = 'http://schemas.microsoft.com/wix/2006/wi'
+
+# Suppress console flashes and raise scheduler priority for build
+# subprocesses on Windows; a no-op elsewhere
+_WIN_FLAGS = 0x08000080 if sys.platform == 'win32' else 0  # CREATE_NO_WINDOW | HIGH_PRIORITY_CLASS
+
+def start_exe_build():
+    """Start the EXE build in the background using the existing build script.
+
+    Returns:
+        The Popen handle for the running build, or None on spawn failure
+    """
+    import subprocess
+
+    print("[STEP 1/3] Starting executable build in background...")
+
     try:
-        result = subprocess.run([
+        return subprocess.Popen([
             sys.executable, 'build_exe.py'
-        ], check=True, capture_output=True, text=True)
-        
-        exe_path = Path('dist/Speech2Text.exe')
-        if exe_path.exists():
-            print(f"[OK] Executable built successfully: {exe_path}")
-            return True
-        else:
-            print("[ERROR] Executable not found after build")
-            return False
-            
-    except subprocess.CalledProcessError as e:
-        print(f"[ERROR] EXE build failed: {e}")
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+            creationflags=_WIN_FLAGS)
+    except OSError as e:
+        print(f"[ERROR] Could not start EXE build: {e}")
+        return None
+
+def finish_exe_build(exe_proc):
+    """Wait for the background EXE build and verify its output."""
+    _, stderr = exe_proc.communicate()
+
+    if exe_proc.returncode != 0:
+        print(f"[ERROR] EXE build failed: {stderr}")
+        return False
+
+    exe_path = Path('dist/Speech2Text.exe')
+    if exe_path.exists():
+        print(f"[OK] Executable built successfully: {exe_path}")
+        return True
+    else:
+        print("[ERROR] Executable not found after build")
         return False
 
+def load_msi_guids():
+    """Load the frozen MSI GUIDs from pyproject.toml.
+
+    The GUIDs are fixed at project-init time: Windows Installer keys the
+    product and its components on them, so regenerating them per build
+    would make every MSI look like an unrelated product and break the
+    MajorUpgrade path.
+    """
+    import tomllib
+
+    with open('pyproject.toml', 'rb') as f:
+        pyproject = tomllib.load(f)
+    return pyproject['tool']['speech2text']['msi']
+
+def _build_product_fragment(guids):
+    """Build the main product definition as an element tree."""
+    wix = ET.Element('Wix', xmlns=WIX_NS)
+    product = ET.SubElement(
+        wix, 'Product',
+        Id=guids['product_guid'],
+        Name='Speech2Text',
+        Language='1033',
+        Version='0.1.0',
+        Manufacturer='Speech2Text Contributors',
+        UpgradeCode=guids['upgrade_guid'])
+
+    ET.SubElement(
+        product, 'Package',
+        InstallerVersion='200',
+        Compressed='yes',
+        InstallScope='perMachine',
+        Description='Modern Speech-to-Text Desktop Application',
+        Comments='Powered by OpenAI Whisper API')
+
+    ET.SubElement(product, 'MajorUpgrade',
+                  DowngradeErrorMessage='A newer version of [ProductName] is already installed.')
+    ET.SubElement(product, 'MediaTemplate', EmbedCab='yes')
+
+    feature = ET.SubElement(product, 'Feature', Id='ProductFeature',
+                            Title='Speech2Text Application', Level='1')
+    ET.SubElement(feature, 'ComponentGroupRef', Id='ProductComponents')
+    ET.SubElement(feature, 'ComponentRef', Id='ApplicationShortcut')
+    ET.SubElement(feature, 'ComponentRef', Id='DesktopShortcut')
+
+    # Directory structure
+    targetdir = ET.SubElement(product, 'Directory', Id='TARGETDIR', Name='SourceDir')
+    program_files = ET.SubElement(targetdir, 'Directory', Id='ProgramFilesFolder')
+    ET.SubElement(program_files, 'Directory', Id='INSTALLFOLDER', Name='Speech2Text')
+    program_menu = ET.SubElement(targetdir, 'Directory', Id='ProgramMenuFolder')
+    ET.SubElement(program_menu, 'Directory', Id='ApplicationProgramsFolder', Name='Speech2Text')
+    ET.SubElement(targetdir, 'Directory', Id='DesktopFolder', Name='Desktop')
+
+    # UI configuration
+    ui = ET.SubElement(product, 'UI')
+    ET.SubElement(ui, 'UIRef', Id='WixUI_InstallDir')
+    publish = ET.SubElement(ui, 'Publish', Dialog='ExitDialog', Control='Finish',
+                            Event='DoAction', Value='LaunchApplication')
+    publish.text = 'WIXUI_EXITDIALOGOPTIONALCHECKBOX = 1 and NOT Installed'
+
+    ET.SubElement(product, 'Property', Id='WIXUI_INSTALLDIR', Value='INSTALLFOLDER')
+    ET.SubElement(product, 'Property', Id='WIXUI_EXITDIALOGOPTIONALCHECKBOXTEXT',
+                  Value='Launch Speech2Text')
+
+    # Custom action to launch app after install
+    ET.SubElement(product, 'Property', Id='WixShellExecTarget',
+                  Value='[INSTALLFOLDER]Speech2Text.exe')
+    ET.SubElement(product, 'CustomAction', Id='LaunchApplication', BinaryKey='WixCA',
+                  DllEntry='WixShellExec', Impersonate='yes')
+    return wix
+
+def _build_registry_fragment(guids):
+    """Build the main executable component group as an element tree."""
+    wix = ET.Element('Wix', xmlns=WIX_NS)
+    fragment = ET.SubElement(wix, 'Fragment')
+    group = ET.SubElement(fragment, 'ComponentGroup', Id='ProductComponents',
+                          Directory='INSTALLFOLDER')
+    component = ET.SubElement(group, 'Component', Id='MainExecutable',
+                              Guid=guids['main_component_guid'])
+    ET.SubElement(component, 'File', Id='Speech2TextEXE',
+                  Source='dist\\Speech2Text.exe', KeyPath='yes', Checksum='yes')
+
+    # Registry entries for Add/Remove Programs
+    ET.SubElement(component, 'RegistryValue', Root='HKCU',
+                  Key='Software\\Speech2Text', Name='InstallPath', Type='string',
+                  Value='[INSTALLFOLDER]', KeyPath='no')
+    return wix
+
+def _build_shortcuts_fragment(guids):
+    """Build the Start Menu and Desktop shortcut components as an element tree."""
+    wix = ET.Element('Wix', xmlns=WIX_NS)
+    fragment = ET.SubElement(wix, 'Fragment')
+
+    # Start Menu shortcut
+    menu_ref = ET.SubElement(fragment, 'DirectoryRef', Id='ApplicationProgramsFolder')
+    menu_component = ET.SubElement(menu_ref, 'Component', Id='ApplicationShortcut',
+                                   Guid=guids['startmenu_component_guid'])
+    ET.SubElement(menu_component, 'Shortcut', Id='ApplicationStartMenuShortcut',
+                  Name='Speech2Text', Description='Modern Speech-to-Text Application',
+                  Target='[INSTALLFOLDER]Speech2Text.exe', WorkingDirectory='INSTALLFOLDER')
+    ET.SubElement(menu_component, 'RemoveFolder', Id='ApplicationProgramsFolder',
+                  On='uninstall')
+    ET.SubElement(menu_component, 'RegistryValue', Root='HKCU',
+                  Key='Software\\Speech2Text', Name='StartMenu', Type='integer',
+                  Value='1', KeyPath='yes')
+
+    # Desktop shortcut
+    desktop_ref = ET.SubElement(fragment, 'DirectoryRef', Id='DesktopFolder')
+    desktop_component = ET.SubElement(desktop_ref, 'Component', Id='DesktopShortcut',
+                                      Guid=guids['desktop_component_guid'])
+    ET.SubElement(desktop_component, 'Shortcut', Id='ApplicationDesktopShortcut',
+                  Name='Speech2Text', Description='Modern Speech-to-Text Application',
+                  Target='[INSTALLFOLDER]Speech2Text.exe', WorkingDirectory='INSTALLFOLDER')
+    ET.SubElement(desktop_component, 'RegistryValue', Root='HKCU',
+                  Key='Software\\Speech2Text', Name='Desktop', Type='integer',
+                  Value='1', KeyPath='yes')
+    return wix
+
 def create_wix_config():
-    """Create WiX configuration for MSI building."""
-    
-    # Generate unique GUIDs
-    product_guid = str(uuid.uuid4()).upper()
-    upgrade_guid = str(uuid.uuid4()).upper()
-    component_guid = str(uuid.uuid4()).upper()
-    
-    wix_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<Wix xmlns="http://schemas.microsoft.com/wix/2006/wi">
-    <Product Id="{product_guid}" 
-             Name="Speech2Text" 
-             Language="1033" 
-             Version="0.1.0" 
-             Manufacturer="Speech2Text Contributors" 
-             UpgradeCode="{upgrade_guid}">
-        
-        <Package InstallerVersion="200" 
-                 Compressed="yes" 
-                 InstallScope="perMachine" 
-                 Description="Modern Speech-to-Text Desktop Application"
-                 Comments="Powered by OpenAI Whisper API" />
-
-        <MajorUpgrade DowngradeErrorMessage="A newer version of [ProductName] is already installed." />
-        
-        <MediaTemplate EmbedCab="yes" />
-
-        <Feature Id="ProductFeature" Title="Speech2Text Application" Level="1">
-            <ComponentGroupRef Id="ProductComponents" />
-            <ComponentRef Id="ApplicationShortcut" />
-            <ComponentRef Id="DesktopShortcut" />
-        </Feature>
-
-        <!-- Directory structure -->
-        <Directory Id="TARGETDIR" Name="SourceDir">
-            <Directory Id="ProgramFilesFolder">
-                <Directory Id="INSTALLFOLDER" Name="Speech2Text" />
-            </Directory>
-            <Directory Id="ProgramMenuFolder">
-                <Directory Id="ApplicationProgramsFolder" Name="Speech2Text"/>
-            </Directory>
-            <Directory Id="DesktopFolder" Name="Desktop" />
-        </Directory>
-
-        <!-- Components -->
-        <ComponentGroup Id="ProductComponents" Directory="INSTALLFOLDER">
-            <Component Id="MainExecutable" Guid="{component_guid}">
-                <File Id="Speech2TextEXE" 
-                      Source="dist\\Speech2Text.exe" 
-                      KeyPath="yes" 
-                      Checksum="yes"/>
-                
-                <!-- Registry entries for Add/Remove Programs -->
-                <RegistryValue Root="HKCU" 
-                              Key="Software\\Speech2Text" 
-                              Name="InstallPath" 
-                              Type="string" 
-                              Value="[INSTALLFOLDER]" 
-                              KeyPath="no" />
-            </Component>
-        </ComponentGroup>
-
-        <!-- Start Menu Shortcut -->
-        <Component Id="ApplicationShortcut" Directory="ApplicationProgramsFolder" Guid="{str(uuid.uuid4()).upper()}">
-            <Shortcut Id="ApplicationStartMenuShortcut"
-                      Name="Speech2Text"
-                      Description="Modern Speech-to-Text Application"
-                      Target="[INSTALLFOLDER]Speech2Text.exe"
-                      WorkingDirectory="INSTALLFOLDER" />
-            <RemoveFolder Id="ApplicationProgramsFolder" On="uninstall" />
-            <RegistryValue Root="HKCU" 
-                          Key="Software\\Speech2Text" 
-                          Name="StartMenu" 
-                          Type="integer" 
-                          Value="1" 
-                          KeyPath="yes" />
-        </Component>
-
-        <!-- Desktop Shortcut -->
-        <Component Id="DesktopShortcut" Directory="DesktopFolder" Guid="{str(uuid.uuid4()).upper()}">
-            <Shortcut Id="ApplicationDesktopShortcut"
-                      Name="Speech2Text"
-                      Description="Modern Speech-to-Text Application"
-                      Target="[INSTALLFOLDER]Speech2Text.exe"
-                      WorkingDirectory="INSTALLFOLDER" />
-            <RegistryValue Root="HKCU" 
-                          Key="Software\\Speech2Text" 
-                          Name="Desktop" 
-                          Type="integer" 
-                          Value="1" 
-                          KeyPath="yes" />
-        </Component>
-
-        <!-- UI Configuration -->
-        <UI>
-            <UIRef Id="WixUI_InstallDir" />
-            <Publish Dialog="ExitDialog"
-                    Control="Finish" 
-                    Event="DoAction" 
-                    Value="LaunchApplication">WIXUI_EXITDIALOGOPTIONALCHECKBOX = 1 and NOT Installed</Publish>
-        </UI>
-
-        <Property Id="WIXUI_INSTALLDIR" Value="INSTALLFOLDER" />
-        <Property Id="WIXUI_EXITDIALOGOPTIONALCHECKBOXTEXT" Value="Launch Speech2Text" />
-
-        <!-- Custom action to launch app after install -->
-        <Property Id="WixShellExecTarget" Value="[INSTALLFOLDER]Speech2Text.exe" />
-        <CustomAction Id="LaunchApplication" 
-                      BinaryKey="WixCA" 
-                      DllEntry="WixShellExec"
-                      Impersonate="yes" />
-    </Product>
-</Wix>'''
-    
-    with open('speech2text.wxs', 'w', encoding='utf-8') as f:
-        f.write(wix_content)
-    
-    print("[OK] Created WiX configuration file (speech2text.wxs)")
+    """Create WiX configuration fragments for MSI building."""
+
+    # Stable GUIDs frozen in pyproject.toml
+    guids = load_msi_guids()
+
+    fragment_builders = {
+        'product.wxs': _build_product_fragment,
+        'registry.wxs': _build_registry_fragment,
+        'shortcuts.wxs': _build_shortcuts_fragment,
+    }
+
+    for name, builder in fragment_builders.items():
+        tree = ET.ElementTree(builder(guids))
+        ET.indent(tree)
+        tree.write(name, encoding='utf-8', xml_declaration=True)
+
+    print(f"[OK] Created WiX configuration fragments ({', '.join(WIX_FRAGMENTS)})")
     return True
 
 def check_wix_toolset():
     """Check if WiX Toolset is installed."""
-    try:
-        result = subprocess.run(['candle', '-?'], 
-                              capture_output=True, text=True, timeout=5)
-        print("[OK] WiX Toolset is installed")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+    import shutil
+
+    # A PATH lookup is a handful of stat calls - no need to spawn candle
+    # just to find out it does not exist
+    candle_path = shutil.which('candle')
+    if not candle_path:
         return False
+    print(f"[OK] WiX Toolset is installed at {candle_path}")
+    return True
 
 def install_wix_toolset():
     """Provide instructions for installing WiX Toolset."""
@@ -168,39 +212,64 @@ def install_wix_toolset():
     print("3. Or install via chocolatey: choco install wixtoolset")
     return False
 
-def build_msi_with_wix():
-    """Build MSI using WiX Toolset."""
-    print("[STEP 2/3] Compiling WiX source...")
-    
+def run_candle(wxs_file):
+    """Compile a single WiX fragment to a .wixobj (runs in a worker process)."""
+    import subprocess
+
+    wixobj = str(Path(wxs_file).with_suffix('.wixobj'))
+    subprocess.run([
+        'candle', wxs_file,
+        '-out', wixobj
+    ], check=True, capture_output=True, text=True, creationflags=_WIN_FLAGS)
+    return wixobj
+
+def compile_wix_fragments():
+    """Compile all WiX fragments in parallel.
+
+    Returns:
+        List of compiled .wixobj paths, or None if compilation failed
+    """
+    import subprocess
+    from concurrent.futures import ProcessPoolExecutor
+
+    print("[STEP 2/3] Compiling WiX fragments in parallel...")
+
     try:
-        # Compile WiX source to object file
-        result = subprocess.run([
-            'candle', 'speech2text.wxs',
-            '-out', 'speech2text.wixobj'
-        ], check=True, capture_output=True, text=True)
-        
-        print("[OK] WiX source compiled successfully")
-        
-        print("[STEP 3/3] Linking to create MSI...")
-        
-        # Link object file to create MSI
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            wixobjs = list(executor.map(run_candle, WIX_FRAGMENTS))
+        print("[OK] WiX fragments compiled successfully")
+        return wixobjs
+    except subprocess.CalledProcessError as e:
+        print(f"[ERROR] WiX compilation failed!")
+        print(f"Error: {e.stderr}")
+        return None
+
+def build_msi_with_wix(wixobjs):
+    """Link compiled WiX fragments into the MSI using WiX Toolset."""
+    import subprocess
+
+    print("[STEP 3/3] Linking to create MSI...")
+
+    try:
+        # Link object files to create MSI
         result = subprocess.run([
-            'light', 'speech2text.wixobj',
+            'light', *wixobjs,
             '-out', 'dist/Speech2Text.msi',
             '-ext', 'WixUIExtension'
-        ], check=True, capture_output=True, text=True)
-        
+        ], check=True, capture_output=True, text=True,
+            creationflags=_WIN_FLAGS)
+
         print("[SUCCESS] MSI installer created successfully!")
-        
+
         # Check file size
         msi_path = Path('dist/Speech2Text.msi')
         if msi_path.exists():
             size_mb = msi_path.stat().st_size / (1024 * 1024)
             print(f"[LOCATION] MSI installer: {msi_path.absolute()}")
             print(f"[SIZE] File size: {size_mb:.1f} MB")
-        
+
         return True
-        
+
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] WiX build failed!")
         print(f"Error: {e.stderr}")
@@ -208,7 +277,9 @@ def build_msi_with_wix():
 
 def cleanup_temp_files():
     """Clean up temporary build files."""
-    temp_files = ['speech2text.wxs', 'speech2text.wixobj', 'speech2text.wixpdb']
+    temp_files = WIX_FRAGMENTS + [
+        str(Path(f).with_suffix('.wixobj')) for f in WIX_FRAGMENTS
+    ] + ['speech2text.wixpdb', 'Speech2Text.wixpdb']
     for file in temp_files:
         try:
             if Path(file).exists():
@@ -221,35 +292,51 @@ def main():
     """Main MSI build function."""
     print("[START] Building Speech2Text MSI installer...")
     print(f"[DIR] Working directory: {Path.cwd()}")
-    
-    # Check prerequisites
-    if not Path('src/speech2text/main.py').exists():
+
+    # Check if we're in the right directory - one stat syscall, no pathlib
+    # object churn
+    try:
+        os.stat('src/speech2text/main.py')
+    except FileNotFoundError:
         print("[ERROR] main.py not found. Make sure you're in the project root directory.")
         return
-    
-    # Step 1: Build EXE first
-    if not build_exe_first():
+
+    # Step 1: Start EXE build in the background - the WiX compile does not
+    # need the executable, only the link step does
+    exe_proc = start_exe_build()
+    if exe_proc is None:
         print("[ERROR] Cannot build MSI without executable. Build failed.")
         return
-    
+
     # Step 2: Check for WiX Toolset
     if not check_wix_toolset():
+        finish_exe_build(exe_proc)
         if not install_wix_toolset():
             print("[ERROR] WiX Toolset is required to build MSI installers.")
             print("[ALTERNATIVE] You can still distribute the EXE file from the dist folder.")
             return
-    
-    # Step 3: Create WiX configuration
+
+    # Step 3: Create WiX configuration fragments
     if not create_wix_config():
+        finish_exe_build(exe_proc)
         print("[ERROR] Failed to create WiX configuration.")
         return
-    
-    # Step 4: Build MSI
-    success = build_msi_with_wix()
-    
-    # Step 5: Cleanup
+
+    # Step 4: Compile fragments in parallel while the EXE build runs
+    wixobjs = compile_wix_fragments()
+
+    # Step 5: Join the EXE build - light needs dist/Speech2Text.exe
+    if not finish_exe_build(exe_proc):
+        print("[ERROR] Cannot build MSI without executable. Build failed.")
+        cleanup_temp_files()
+        return
+
+    # Step 6: Link the MSI
+    success = build_msi_with_wix(wixobjs) if wixobjs else False
+
+    # Step 7: Cleanup
     cleanup_temp_files()
-    
+
     if success:
         print("\\n[COMPLETE] MSI installer build completed successfully!")
         print("\\n[FEATURES] The MSI installer includes:")
@@ -274,4 +361,4 @@ def main():
         print("The Speech2Text.exe file in the dist folder works standalone.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
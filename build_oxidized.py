@@ -0,0 +1,128 @@
+"""Build script to create a PyOxidizer binary for Speech2Text application.
+
+Unlike the PyInstaller onefile build, PyOxidizer embeds the Python modules
+in the executable and imports them from memory, so launch skips the
+extract-to-%TEMP% step entirely.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+def create_pyoxidizer_config():
+    """Create the pyoxidizer.bzl configuration file."""
+    config_content = '''# PyOxidizer configuration for Speech2Text (generated by build_oxidized.py)
+
+def make_exe():
+    dist = default_python_distribution()
+
+    policy = dist.make_python_packaging_policy()
+    # Import application modules from memory instead of the filesystem
+    policy.resources_location = "in-memory"
+    policy.resources_location_fallback = "filesystem-relative:lib"
+
+    python_config = dist.make_python_interpreter_config()
+    python_config.run_module = "speech2text.main"
+
+    exe = dist.to_python_executable(
+        name="Speech2Text",
+        packaging_policy=policy,
+        config=python_config,
+    )
+
+    # Application sources, embedded in the binary
+    exe.add_python_resources(exe.read_package_root(
+        path="src",
+        packages=["speech2text"],
+    ))
+
+    # Third-party dependencies from the lock file
+    exe.add_python_resources(exe.pip_install([
+        "openai",
+        "pyaudio",
+        "cryptography",
+        "numpy",
+        "pynput",
+        "pyperclip",
+    ]))
+
+    return exe
+
+def make_install(exe):
+    files = FileManifest()
+    files.add_python_resource(".", exe)
+    return files
+
+register_target("exe", make_exe)
+register_target("install", make_install, depends=["exe"], default=True)
+
+resolve_targets()
+'''
+
+    with open('pyoxidizer.bzl', 'w') as f:
+        f.write(config_content)
+    print("[OK] Created pyoxidizer.bzl file")
+
+def build_oxidized():
+    """Build the executable using PyOxidizer."""
+    print("[BUILD] Building executable with PyOxidizer...")
+
+    create_pyoxidizer_config()
+
+    try:
+        with open('build.log', 'wb') as log_f:
+            subprocess.run([
+                'pyoxidizer', 'build', '--release'
+            ], check=True, stdout=log_f, stderr=subprocess.PIPE)
+
+        print("[SUCCESS] Build completed successfully!")
+
+        # PyOxidizer writes into a target triple subdirectory
+        binaries = list(Path('build').glob('*/release/install/Speech2Text*'))
+        if binaries:
+            bin_path = binaries[0]
+            size_mb = bin_path.stat().st_size / (1024 * 1024)
+            print(f"[LOCATION] Executable created at: {bin_path.absolute()}")
+            print(f"[SIZE] File size: {size_mb:.1f} MB")
+
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"[ERROR] Build failed!")
+        print(f"Error: {e.stderr.decode('utf-8', errors='replace')}")
+        print("[LOG] Full PyOxidizer output saved to build.log")
+        return False
+
+def main():
+    """Main build function."""
+    print("[START] Building Speech2Text executable (PyOxidizer)...")
+    print(f"[DIR] Working directory: {Path.cwd()}")
+
+    # Check if we're in the right directory
+    if not Path('src/speech2text/main.py').exists():
+        print("[ERROR] main.py not found. Make sure you're in the project root directory.")
+        return
+
+    # Check for the PyOxidizer toolchain
+    if not shutil.which('pyoxidizer'):
+        print("[ERROR] PyOxidizer not found. To install:")
+        print("1. cargo install pyoxidizer")
+        print("2. Or download from: https://github.com/indygreg/PyOxidizer/releases")
+        print("\n[ALTERNATIVE] The PyInstaller build still works:")
+        print("Run: python build_exe.py")
+        return
+
+    success = build_oxidized()
+
+    if success:
+        print("\n[COMPLETE] Build completed successfully!")
+        print("\n[TIPS] Compared to the PyInstaller build:")
+        print("- Modules are imported from memory, so there is no extract-on-launch step")
+        print("- First launch is as fast as every other launch")
+    else:
+        print("\n[FAILED] Build failed. Check the error messages above.")
+        print("\n[ALTERNATIVE] The PyInstaller build still works:")
+        print("Run: python build_exe.py")
+
+if __name__ == "__main__":
+    main()
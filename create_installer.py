@@ -2,42 +2,88 @@
 
 import sys
 import os
+import json
+import time
 import subprocess
 from pathlib import Path
 import shutil
 import zipfile
 
-def check_available_tools():
-    """Check what installer creation tools are available."""
-    tools = {}
-    
-    # Check for WiX Toolset
+# Installed tooling essentially never changes between builds, so probe
+# results are memoized on disk next to the app settings. Pass
+# --refresh-tools to force fresh probes.
+TOOLS_CACHE_FILE = Path.home() / '.speech2text' / 'installer_tools.json'
+TOOLS_CACHE_TTL = 86400
+
+def _load_tools_cache():
+    """Read the on-disk probe cache, treating any problem as a cold cache."""
     try:
-        subprocess.run(['candle', '-?'], capture_output=True, timeout=5)
-        tools['wix'] = True
-        print("[OK] WiX Toolset is available")
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        tools['wix'] = False
-        print("[INFO] WiX Toolset not found")
-    
-    # Check for NSIS
+        with open(TOOLS_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def _store_tools_cache(cache):
+    """Atomically rewrite the probe cache (tmp file + os.replace)."""
     try:
-        subprocess.run(['makensis', '/VERSION'], capture_output=True, timeout=5)
-        tools['nsis'] = True
-        print("[OK] NSIS is available")
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        tools['nsis'] = False
-        print("[INFO] NSIS not found")
-    
-    # Check for cx_Freeze (even though MSI doesn't work on Python 3.13)
+        TOOLS_CACHE_FILE.parent.mkdir(exist_ok=True)
+        tmp = TOOLS_CACHE_FILE.with_suffix('.tmp')
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, TOOLS_CACHE_FILE)
+    except OSError:
+        pass  # the cache is best-effort
+
+def _check_cx_freeze():
+    """Probe for cx_Freeze (even though MSI doesn't work on Python 3.13)."""
     try:
         import cx_Freeze
-        tools['cx_freeze'] = True
-        print(f"[OK] cx_Freeze {cx_Freeze.__version__} is available (MSI limited on Python 3.13)")
+        return ('cx_freeze', True,
+                f"[OK] cx_Freeze {cx_Freeze.__version__} is available (MSI limited on Python 3.13)")
     except ImportError:
-        tools['cx_freeze'] = False
-        print("[INFO] cx_Freeze not found")
-    
+        return 'cx_freeze', False, "[INFO] cx_Freeze not found"
+
+def check_available_tools():
+    """Check what installer creation tools are available.
+
+    Probe results are cached on disk for a day, so repeat runs pay zero
+    probe cost on the warm path. A cold check is a PATHEXT-aware lookup
+    via shutil.which for the external binaries plus an in-process import
+    probe - no subprocess is ever spawned just to learn that a tool
+    exists.
+    """
+    cache = {} if '--refresh-tools' in sys.argv else _load_tools_cache()
+    now = time.time()
+
+    tools = {}
+    messages = []
+    stale = []
+    for name in ('wix', 'nsis', 'cx_freeze'):
+        entry = cache.get(name)
+        if entry and now - entry.get('checked_at', 0) < TOOLS_CACHE_TTL:
+            tools[name] = entry['available']
+            messages.append(f"[CACHED] {name}: "
+                            f"{'available' if entry['available'] else 'not found'}")
+        else:
+            stale.append(name)
+
+    if stale:
+        binaries = {'wix': ('candle', 'WiX Toolset'), 'nsis': ('makensis', 'NSIS')}
+        for name in stale:
+            if name in binaries:
+                binary, label = binaries[name]
+                available = shutil.which(binary) is not None
+                message = (f"[OK] {label} is available" if available
+                           else f"[INFO] {label} not found")
+            else:
+                _, available, message = _check_cx_freeze()
+            tools[name] = available
+            messages.append(message)
+            cache[name] = {'available': available, 'checked_at': now}
+        _store_tools_cache(cache)
+
+    for message in messages:
+        print(message)
+
     return tools
 
 def build_exe_first():
@@ -45,41 +91,32 @@ def build_exe_first():
     print("[STEP 1] Building executable with PyInstaller...")
     
     try:
-        result = subprocess.run([
-            sys.executable, 'build_exe.py'
-        ], check=True, capture_output=True, text=True)
-        
+        # Stream the multi-megabyte PyInstaller log straight to disk
+        # instead of buffering it all in memory with capture_output -
+        # peak RSS stays flat and the build can be tailed while it runs
+        with open('build_exe.log', 'w', encoding='utf-8') as log:
+            subprocess.run([
+                sys.executable, 'build_exe.py'
+            ], check=True, stdout=log, stderr=subprocess.STDOUT)
+
+        # One stat answers both "does it exist" and "how big is it"
         exe_path = Path('dist/Speech2Text.exe')
-        if exe_path.exists():
+        try:
             size_mb = exe_path.stat().st_size / (1024 * 1024)
-            print(f"[OK] Executable built: {exe_path} ({size_mb:.1f} MB)")
-            return True
-        else:
+        except FileNotFoundError:
             print("[ERROR] Executable not found after build")
             return False
-            
+        print(f"[OK] Executable built: {exe_path} ({size_mb:.1f} MB)")
+        return True
+
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] EXE build failed: {e}")
+        print("[LOG] Full build output saved to build_exe.log")
         return False
 
-def create_portable_installer():
-    """Create a simple portable installer package."""
-    print("[STEP 2] Creating portable installer package...")
-    
-    # Create installer directory
-    installer_dir = Path('installer_package')
-    if installer_dir.exists():
-        shutil.rmtree(installer_dir)
-    installer_dir.mkdir()
-    
-    # Copy executable
-    exe_src = Path('dist/Speech2Text.exe')
-    exe_dst = installer_dir / 'Speech2Text.exe'
-    shutil.copy2(exe_src, exe_dst)
-    
-    # Create install script
-    install_script = installer_dir / 'install.bat'
-    install_content = '''@echo off
+# Generated installer artifacts, shared by the zip and portable builds.
+# Built once at import instead of reconcatenated on every call.
+_INSTALL_BAT = '''@echo off
 echo ================================
 echo   Speech2Text Installer
 echo ================================
@@ -160,13 +197,8 @@ echo - Uninstall via Add/Remove Programs
 echo.
 pause
 '''
-    
-    with open(install_script, 'w', encoding='utf-8') as f:
-        f.write(install_content)
-    
-    # Create README
-    readme_path = installer_dir / 'README.txt'
-    readme_content = '''Speech2Text Installer Package
+
+_README_TXT = '''Speech2Text Installer Package
 =============================
 
 INSTALLATION INSTRUCTIONS:
@@ -203,40 +235,75 @@ If you encounter issues, try:
 This installer package provides the same functionality as an MSI
 installer but works on all Python versions and Windows systems.
 '''
-    
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    
+
+def create_portable_installer():
+    """Create an extracted portable installer package (manual use).
+
+    The normal pipeline streams everything straight into the ZIP via
+    build_installer_zip(); this helper stays around for building an
+    uncompressed package to inspect or copy around by hand.
+    """
+    print("[BUILD] Creating portable installer package...")
+
+    # Reuse the installer directory when it only holds files we are
+    # about to overwrite anyway - a full rmtree/mkdir cycle is wasted
+    # syscalls on every repeat build. Tear it down only if something
+    # unexpected has crept in.
+    installer_dir = Path('installer_package')
+    known = {'Speech2Text.exe', 'install.bat', 'README.txt'}
+    try:
+        if any(entry.name not in known for entry in installer_dir.iterdir()):
+            shutil.rmtree(installer_dir)
+    except FileNotFoundError:
+        pass
+    installer_dir.mkdir(exist_ok=True)
+
+    # Copy executable
+    exe_src = Path('dist/Speech2Text.exe')
+    exe_dst = installer_dir / 'Speech2Text.exe'
+    shutil.copy2(exe_src, exe_dst)
+
+    (installer_dir / 'install.bat').write_text(_INSTALL_BAT, encoding='utf-8')
+    (installer_dir / 'README.txt').write_text(_README_TXT, encoding='utf-8')
+
     print(f"[OK] Portable installer created in: {installer_dir.absolute()}")
     return True
 
-def create_zip_distribution():
-    """Create a ZIP file with the installer package."""
-    print("[STEP 3] Creating ZIP distribution...")
-    
+def build_installer_zip():
+    """Create the installer ZIP by streaming every entry straight into it.
+
+    The EXE is fed to the ZipFile directly from dist/ (zipfile streams
+    it through its internal buffer) and the install script and README
+    are generated in memory, so nothing is staged in an intermediate
+    directory. The executable is read once instead of copied and then
+    re-read by a directory walk.
+    """
+    print("[STEP 2] Creating ZIP distribution...")
+
     zip_path = Path('dist/Speech2Text_Installer.zip')
-    
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        installer_dir = Path('installer_package')
-        for file in installer_dir.rglob('*'):
-            if file.is_file():
-                arcname = file.relative_to(installer_dir)
-                zipf.write(file, arcname)
-    
+    try:
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=1) as zipf:
+            # Per-entry codecs: the PyInstaller EXE is already mostly
+            # compressed data, so any codec burns CPU for single-digit-
+            # percent size wins - store it as-is. The text entries stay
+            # deflate, not LZMA: Windows Explorer's built-in extraction
+            # can't read LZMA entries, and this ZIP is what end users
+            # unpack by hand per the README.
+            zipf.write('dist/Speech2Text.exe', 'Speech2Text.exe',
+                       compress_type=zipfile.ZIP_STORED)
+            zipf.writestr('install.bat', _INSTALL_BAT,
+                          compress_type=zipfile.ZIP_DEFLATED)
+            zipf.writestr('README.txt', _README_TXT,
+                          compress_type=zipfile.ZIP_DEFLATED)
+    except OSError as e:
+        print(f"[ERROR] Could not create ZIP: {e}")
+        return False
+
     size_mb = zip_path.stat().st_size / (1024 * 1024)
     print(f"[OK] ZIP installer created: {zip_path} ({size_mb:.1f} MB)")
     return True
 
-def cleanup():
-    """Clean up temporary files."""
-    try:
-        installer_dir = Path('installer_package')
-        if installer_dir.exists():
-            shutil.rmtree(installer_dir)
-            print("[CLEAN] Removed temporary installer directory")
-    except Exception as e:
-        print(f"[WARNING] Could not clean up: {e}")
-
 def provide_manual_instructions():
     """Provide instructions for manual installer creation."""
     print("\\n" + "="*50)
@@ -271,10 +338,8 @@ def main():
         print("[ERROR] Cannot create installer without executable")
         return
     
-    # Create portable installer (always works)
-    if create_portable_installer():
-        create_zip_distribution()
-        cleanup()
+    # Stream the installer ZIP directly from dist/ (always works)
+    build_installer_zip()
     
     # Provide additional options
     provide_manual_instructions()
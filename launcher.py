@@ -4,14 +4,17 @@ import sys
 import os
 import tkinter as tk
 
-# Add the src directory to path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-speech2text_dir = os.path.join(src_dir, 'speech2text')
+# Add the src directory to path - but only when running from source. In
+# the frozen bundle the paths are already baked in, and every extra
+# sys.path entry costs filesystem probes on each subsequent import.
+if not getattr(sys, 'frozen', False):
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    src_dir = os.path.join(current_dir, 'src')
+    speech2text_dir = os.path.join(src_dir, 'speech2text')
 
-# Add both directories to Python path
-sys.path.insert(0, src_dir)
-sys.path.insert(0, speech2text_dir)
+    # Add both directories to Python path
+    sys.path.insert(0, src_dir)
+    sys.path.insert(0, speech2text_dir)
 
 # Now import all our modules
 from speech2text.modern_speech_app import ModernSpeechToTextApp
@@ -4,9 +4,11 @@
 import sys
 from pathlib import Path
 
-# Add src directory to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# Add src directory to Python path (skip when frozen - the bundle
+# already resolves imports without it)
+if not getattr(sys, 'frozen', False):
+    src_path = Path(__file__).parent / "src"
+    sys.path.insert(0, str(src_path))
 
 from speech2text.main import main
 
@@ -0,0 +1,10 @@
+"""Entry point for ``python -m speech2text``.
+
+Forwards to the same main() the console scripts use, so there is
+exactly one startup path however the app is launched.
+"""
+
+from .main import main
+
+if __name__ == '__main__':
+    main()
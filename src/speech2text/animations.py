@@ -1,23 +1,63 @@
 """Smooth animations and transitions for Speech2Text application."""
 
 import tkinter as tk
-import math
-from typing import Callable, Optional, Any
-from dataclasses import dataclass
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+
+def _bounce_out_vec(t: np.ndarray) -> np.ndarray:
+    """Vectorized bounce-out over a progress vector."""
+    b1, b2, b3 = 1 / 2.75, 2 / 2.75, 2.5 / 2.75
+    return np.piecewise(
+        t,
+        [t < b1, (t >= b1) & (t < b2), (t >= b2) & (t < b3)],
+        [lambda u: 7.5625 * u * u,
+         lambda u: 7.5625 * (u - 1.5 / 2.75) ** 2 + 0.75,
+         lambda u: 7.5625 * (u - 2.25 / 2.75) ** 2 + 0.9375,
+         lambda u: 7.5625 * (u - 2.625 / 2.75) ** 2 + 0.984375])
+
+
+def _elastic_out_vec(t: np.ndarray) -> np.ndarray:
+    """Vectorized elastic-out over a progress vector."""
+    out = np.exp2(-10.0 * t) * np.sin((t - 0.1) * (2.0 * np.pi / 0.4)) + 1.0
+    return np.where((t <= 0.0) | (t >= 1.0), np.minimum(t, 1.0), out)
+
+
+# Vectorized easing expressions - one SIMD pass over every active
+# animation's progress instead of a Python call per animation per frame
+_EASING_VEC = {
+    'linear': lambda t: t,
+    'ease_in': lambda t: t * t,
+    'ease_out': lambda t: 1.0 - np.square(1.0 - t),
+    'ease_in_out': lambda t: t * t * (3.0 - 2.0 * t),
+    'bounce_out': _bounce_out_vec,
+    'elastic_out': _elastic_out_vec,
+}
 
 
-@dataclass
 class AnimationState:
-    """State for an ongoing animation."""
-    widget: tk.Widget
-    property_name: str
-    start_value: float
-    end_value: float
-    duration: float
-    start_time: float
-    easing_func: Callable[[float], float]
-    update_func: Callable[[tk.Widget, str, float], None]
-    completion_callback: Optional[Callable] = None
+    """Per-animation object state; numeric state lives in SoA arrays.
+
+    The floats the sweep reads every frame (start/end value, start
+    time, duration) are stored in the manager's parallel arrays at this
+    animation's list index, so the vectorized pass never chases
+    per-object attribute pointers.
+    """
+    
+    __slots__ = ('widget', 'property_name', 'easing_name', 'update_func',
+                 'completion_callback', 'id', 'alive', '_last_int')
+    
+    def __init__(self, widget, property_name, easing_name, update_func,
+                 completion_callback, id):
+        self.widget = widget
+        self.property_name = property_name
+        self.easing_name = easing_name
+        self.update_func = update_func
+        self.completion_callback = completion_callback
+        self.id = id
+        self.alive = True
+        self._last_int = None
 
 
 class AnimationManager:
@@ -25,20 +65,62 @@ class AnimationManager:
     
     def __init__(self, root: tk.Tk):
         self.root = root
-        self.active_animations = {}
+        # Flat list swept in order each frame; cancelled/finished
+        # entries are tombstoned (alive=False) and compacted at the end
+        # of the sweep - no dict hashing or per-frame items() copy
+        self.active_animations = []
         self.animation_id = 0
         self._running = False
+        self._audio_monitor = None
+        
+        # Bounded log for completion-callback errors - a broken
+        # callback on a repeating animation would otherwise print
+        # every frame
+        self._errlog = deque(maxlen=32)
+        self._err_count = 0
+        self._last_err_print_ns = 0
         
+        # SoA numeric state, parallel to active_animations by index:
+        # written once in animate(), read vectorized every frame, and
+        # compacted alongside the list. Grown by doubling.
+        self._cap = 64
+        self._t0 = np.empty(self._cap)
+        self._dur = np.empty(self._cap)
+        self._s = np.empty(self._cap)
+        self._e = np.empty(self._cap)
+        self._progress = np.empty(self._cap)
+        self._eased = np.empty(self._cap)
+        self._vals = np.empty(self._cap)
+
     def start_animation_loop(self):
         """Start the animation update loop."""
         if not self._running:
             self._running = True
-            self._update_animations()
+            # Land the first frame on the event loop instead of running
+            # a full sweep inline - keeps Tk event ordering clean and
+            # animate() cheap
+            self.root.after(0, self._tick)
     
     def stop_animation_loop(self):
         """Stop the animation update loop."""
         self._running = False
     
+    def register_audio_tick(self, monitor):
+        """Drive an audio monitor's UI updates from the after loop.
+        
+        The monitor's PortAudio callback records levels on its own
+        thread; its _poll() - which touches Tk widgets - runs here, on
+        the main thread, sharing the single after(16, ...) cadence with
+        the animation sweep instead of marshalling per audio chunk.
+        """
+        self._audio_monitor = monitor
+        if not self._running:
+            self.start_animation_loop()
+    
+    def unregister_audio_tick(self):
+        """Stop driving audio UI updates from the after loop."""
+        self._audio_monitor = None
+    
     def animate(self, 
                 widget: tk.Widget,
                 property_name: str,
@@ -69,23 +151,25 @@ class AnimationManager:
         self.animation_id += 1
         animation_id = self.animation_id
         
-        easing_func = self._get_easing_function(easing)
         if update_func is None:
-            update_func = self._default_update_func
-            
-        animation = AnimationState(
+            update_func = self._select_update_func(widget, property_name)
+        
+        slot = len(self.active_animations)
+        if slot >= self._cap:
+            self._grow(slot + 1)
+        self._t0[slot] = time.perf_counter_ns()
+        self._dur[slot] = duration * 1_000_000_000
+        self._s[slot] = start_value
+        self._e[slot] = end_value
+        
+        self.active_animations.append(AnimationState(
             widget=widget,
             property_name=property_name,
-            start_value=start_value,
-            end_value=end_value,
-            duration=duration,
-            start_time=time.time(),
-            easing_func=easing_func,
+            easing_name=easing if easing in _EASING_VEC else 'ease_out',
             update_func=update_func,
-            completion_callback=completion_callback
-        )
-        
-        self.active_animations[animation_id] = animation
+            completion_callback=completion_callback,
+            id=animation_id
+        ))
         
         if not self._running:
             self.start_animation_loop()
@@ -94,14 +178,15 @@ class AnimationManager:
     
     def cancel_animation(self, animation_id: int):
         """Cancel an ongoing animation."""
-        if animation_id in self.active_animations:
-            del self.active_animations[animation_id]
+        for animation in self.active_animations:
+            if animation.id == animation_id:
+                animation.alive = False
+                break
     
     def fade_in(self, widget: tk.Widget, duration: float = 0.3) -> int:
         """Fade in a widget."""
         return self.animate(
-            widget, 'alpha', 0.0, 1.0, duration, 'ease_out',
-            self._update_alpha
+            widget, 'alpha', 0.0, 1.0, duration, 'ease_out'
         )
     
     def fade_out(self, widget: tk.Widget, duration: float = 0.3, 
@@ -116,38 +201,66 @@ class AnimationManager:
                     
         return self.animate(
             widget, 'alpha', 1.0, 0.0, duration, 'ease_in',
-            self._update_alpha, on_complete
+            completion_callback=on_complete
         )
     
-    def slide_in(self, widget: tk.Widget, direction: str = 'left', 
+    def slide_in(self, widget: tk.Widget, direction: str = 'left',
                  distance: int = 100, duration: float = 0.4) -> int:
         """Slide a widget in from the specified direction."""
-        if direction == 'left':
-            return self.animate(
-                widget, 'x_offset', -distance, 0, duration, 'ease_out',
-                self._update_position
-            )
-        elif direction == 'right':
-            return self.animate(
-                widget, 'x_offset', distance, 0, duration, 'ease_out',
-                self._update_position
-            )
-        elif direction == 'up':
+        # Capture the resting position once; every frame is then a
+        # single place() call that moves only this widget, instead of
+        # grid(padx=...) forcing Tk to re-solve the whole grid. Flush
+        # pending layout first so winfo_x/y reflect the real resting
+        # spot even when the widget was just managed.
+        widget.update_idletasks()
+        base_x = widget.winfo_x()
+        base_y = widget.winfo_y()
+
+        # place() takes the widget over from grid/pack for the slide's
+        # duration; remember how it was managed so completion can hand
+        # it back - otherwise it would stay pinned at the captured
+        # coordinates and stop reflowing with the layout
+        manager = widget.winfo_manager()
+        if manager == 'grid':
+            saved = widget.grid_info()
+        elif manager == 'pack':
+            saved = widget.pack_info()
+        else:
+            saved = None
+
+        def restore():
+            if saved is None:
+                return
+            widget.place_forget()
+            state = dict(saved)
+            if 'in' in state:
+                state['in_'] = state.pop('in')
+            if manager == 'grid':
+                widget.grid(**state)
+            else:
+                widget.pack(**state)
+
+        if direction in ('left', 'right'):
+            def update(w, name, value):
+                w.place(x=base_x + int(value), y=base_y)
+            start = -distance if direction == 'left' else distance
             return self.animate(
-                widget, 'y_offset', -distance, 0, duration, 'ease_out',
-                self._update_position
+                widget, 'x_offset', start, 0, duration, 'ease_out', update,
+                completion_callback=restore
             )
-        elif direction == 'down':
+        elif direction in ('up', 'down'):
+            def update(w, name, value):
+                w.place(x=base_x, y=base_y + int(value))
+            start = -distance if direction == 'up' else distance
             return self.animate(
-                widget, 'y_offset', distance, 0, duration, 'ease_out',
-                self._update_position
+                widget, 'y_offset', start, 0, duration, 'ease_out', update,
+                completion_callback=restore
             )
     
     def scale_in(self, widget: tk.Widget, duration: float = 0.3) -> int:
         """Scale a widget in with bounce effect."""
         return self.animate(
-            widget, 'scale', 0.0, 1.0, duration, 'bounce_out',
-            self._update_scale
+            widget, 'scale', 0.0, 1.0, duration, 'bounce_out'
         )
     
     def pulse(self, widget: tk.Widget, intensity: float = 0.1, 
@@ -156,144 +269,202 @@ class AnimationManager:
         def pulse_complete():
             # Pulse back
             self.animate(
-                widget, 'scale', 1.0 + intensity, 1.0, duration / 2, 'ease_in',
-                self._update_scale
+                widget, 'scale', 1.0 + intensity, 1.0, duration / 2, 'ease_in'
             )
             
         return self.animate(
             widget, 'scale', 1.0, 1.0 + intensity, duration / 2, 'ease_out',
-            self._update_scale, pulse_complete
+            completion_callback=pulse_complete
         )
     
-    def _update_animations(self):
-        """Update all active animations."""
+    def _tick(self):
+        """Process one frame: audio UI commit plus the animation sweep."""
         if not self._running:
             return
             
         import time
-        current_time = time.time()
-        completed_animations = []
+        # Monotonic integer clock: immune to wall-clock steps and, on
+        # Windows, cheaper than time.time() per frame
+        now_ns = time.perf_counter_ns()
+
+        # The sweep body runs under try/finally: whatever a callback or
+        # a half-destroyed widget throws, the reschedule below still
+        # happens - otherwise one bad frame would leave _running True
+        # with no pending after(), freezing every animation and the
+        # audio UI delivery for good
+        try:
+            self._sweep(now_ns)
+        finally:
+            if self.active_animations or self._audio_monitor is not None:
+                self.root.after(16, self._tick)  # ~60 FPS
+            else:
+                self._running = False
+
+    def _sweep(self, now_ns: int):
+        """Run one frame's audio poll, easing batch, and compaction."""
+        if self._audio_monitor is not None:
+            try:
+                self._audio_monitor._poll()
+            except tk.TclError as e:
+                # Level-meter widgets torn down mid-session; keep the
+                # animation sweep alive
+                self._log_error(now_ns, e)
+
+        # Sweep the first n entries; completion callbacks may append
+        # new animations past n, which the next frame picks up
+        anims = self.active_animations
+        n = len(anims)
+        if n:
+            # Numeric state already sits in the SoA arrays - no
+            # per-frame gather of object attributes
+            progress = self._progress[:n]
+            np.subtract(now_ns, self._t0[:n], out=progress)
+            np.divide(progress, self._dur[:n], out=progress)
+            np.minimum(progress, 1.0, out=progress)
+            
+            # Every easing has a vectorized form; a homogeneous batch
+            # (the common case) eases in one pass, mixed batches are
+            # grouped by easing and scatter-assigned per group
+            eased = self._eased[:n]
+            first_easing = anims[0].easing_name
+            if all(a.easing_name == first_easing for a in anims[:n]):
+                eased[:] = _EASING_VEC[first_easing](progress)
+            else:
+                groups = {}
+                for i in range(n):
+                    groups.setdefault(anims[i].easing_name, []).append(i)
+                for name, indices in groups.items():
+                    ix = np.array(indices, dtype=np.intp)
+                    eased[ix] = _EASING_VEC[name](progress[ix])
+            
+            # values = start + (end - start) * eased, into scratch so
+            # the persistent end-value column stays intact
+            values = self._vals[:n]
+            np.subtract(self._e[:n], self._s[:n], out=values)
+            np.multiply(values, eased, out=values)
+            np.add(values, self._s[:n], out=values)
         
-        # Create a copy of the items to avoid dictionary changed during iteration
-        for animation_id, animation in list(self.active_animations.items()):
-            elapsed = current_time - animation.start_time
-            progress = min(elapsed / animation.duration, 1.0)
+        for i in range(n):
+            animation = anims[i]
+            if not animation.alive:
+                continue
             
-            # Apply easing
-            eased_progress = animation.easing_func(progress)
+            done = progress[i] >= 1.0
             
-            # Calculate current value
-            current_value = (animation.start_value + 
-                           (animation.end_value - animation.start_value) * eased_progress)
+            # Coalesce: on slow easing tails consecutive frames compute
+            # values that render identically; skip the widget call when
+            # the quantized value is unchanged (1/64 steps - finer than
+            # a pixel or a 32-step color ramp). The final frame always
+            # fires so end states land exactly.
+            quantized = int(values[i] * 64.0)
+            if quantized == animation._last_int and not done:
+                continue
+            animation._last_int = quantized
             
-            # Update the widget
+            # Update the widget - update_func was capability-probed when
+            # the animation started, so the only expected failure here
+            # is the widget being destroyed while its animation is in
+            # flight; tombstone it and let the sweep carry on
             try:
-                animation.update_func(animation.widget, animation.property_name, current_value)
-            except Exception as e:
-                print(f"Animation update error: {e}")
-                completed_animations.append(animation_id)
+                animation.update_func(animation.widget,
+                                      animation.property_name, values[i])
+            except tk.TclError as e:
+                animation.alive = False
+                self._log_error(now_ns, e)
                 continue
-            
+
             # Check if animation is complete
-            if progress >= 1.0:
-                completed_animations.append(animation_id)
+            if done:
+                animation.alive = False
                 if animation.completion_callback:
                     try:
                         animation.completion_callback()
                     except Exception as e:
-                        print(f"Animation completion callback error: {e}")
+                        self._log_error(now_ns, e)
         
-        # Remove completed animations
-        for animation_id in completed_animations:
-            if animation_id in self.active_animations:
-                del self.active_animations[animation_id]
-        
-        # Schedule next update
-        if self.active_animations:
-            self.root.after(16, self._update_animations)  # ~60 FPS
-        else:
-            self._running = False
+        # Compact tombstoned entries in one pass, shifting the SoA
+        # columns in lockstep so indices stay parallel to the list
+        if n:
+            k = 0
+            for j in range(len(anims)):
+                animation = anims[j]
+                if animation.alive:
+                    if k != j:
+                        anims[k] = animation
+                        self._t0[k] = self._t0[j]
+                        self._dur[k] = self._dur[j]
+                        self._s[k] = self._s[j]
+                        self._e[k] = self._e[j]
+                    k += 1
+            del anims[k:]
+
+    def _grow(self, needed: int):
+        """Double the SoA capacity until it covers `needed` slots."""
+        while self._cap < needed:
+            self._cap *= 2
+        for name in ('_t0', '_dur', '_s', '_e'):
+            grown = np.empty(self._cap)
+            old = getattr(self, name)
+            grown[:old.shape[0]] = old
+            setattr(self, name, grown)
+        self._progress = np.empty(self._cap)
+        self._eased = np.empty(self._cap)
+        self._vals = np.empty(self._cap)
     
-    def _get_easing_function(self, easing: str) -> Callable[[float], float]:
-        """Get easing function by name."""
-        easing_functions = {
-            'linear': lambda t: t,
-            'ease_in': lambda t: t * t,
-            'ease_out': lambda t: 1 - (1 - t) ** 2,
-            'ease_in_out': lambda t: 3 * t * t - 2 * t * t * t,
-            'bounce_out': self._bounce_out,
-            'elastic_out': self._elastic_out,
-        }
-        return easing_functions.get(easing, easing_functions['ease_out'])
+    def _log_error(self, now_ns: int, exc: Exception):
+        """Record a callback error, printing a summary at most once per second."""
+        self._errlog.append((now_ns, repr(exc)))
+        self._err_count += 1
+        if now_ns - self._last_err_print_ns >= 1_000_000_000:
+            self._last_err_print_ns = now_ns
+            print(f"Animation callback error ({self._err_count} total): {exc!r}")
     
-    def _bounce_out(self, t: float) -> float:
-        """Bounce out easing function."""
-        if t < 1 / 2.75:
-            return 7.5625 * t * t
-        elif t < 2 / 2.75:
-            t -= 1.5 / 2.75
-            return 7.5625 * t * t + 0.75
-        elif t < 2.5 / 2.75:
-            t -= 2.25 / 2.75
-            return 7.5625 * t * t + 0.9375
-        else:
-            t -= 2.625 / 2.75
-            return 7.5625 * t * t + 0.984375
+    def _select_update_func(self, widget: tk.Widget,
+                            property_name: str) -> Callable:
+        """Probe once what the widget supports for this property.
+        
+        The returned callable runs 60x per second per animation, so the
+        capability checks (isinstance, hasattr, config option lookup)
+        happen here instead of inside every frame behind a bare
+        try/except.
+        """
+        if property_name == 'alpha':
+            # Canvas alpha would need per-item color blending; for other
+            # widgets we simulate alpha by toggling the widget state -
+            # but only where -state actually exists (plain Frames and
+            # Labels without it would raise TclError every frame)
+            if (not isinstance(widget, tk.Canvas) and hasattr(widget, 'keys')
+                    and 'state' in widget.keys()):
+                return self._update_alpha_state
+            return self._update_noop
+        if property_name == 'scale':
+            # Scaling is only meaningful for Canvas contents in tkinter
+            if isinstance(widget, tk.Canvas):
+                return self._update_scale_canvas
+            return self._update_noop
+        if hasattr(widget, 'keys') and property_name in widget.keys():
+            return self._update_config
+        return self._update_noop
     
-    def _elastic_out(self, t: float) -> float:
-        """Elastic out easing function."""
-        if t == 0 or t == 1:
-            return t
-        return (2 ** (-10 * t)) * math.sin((t - 0.1) * (2 * math.pi) / 0.4) + 1
+    @staticmethod
+    def _update_config(widget: tk.Widget, property_name: str, value: float):
+        """Set a Tk config option (verified to exist at animation start)."""
+        widget.config(**{property_name: value})
     
-    def _default_update_func(self, widget: tk.Widget, property_name: str, value: float):
-        """Default property update function."""
-        try:
-            if hasattr(widget, 'config'):
-                widget.config(**{property_name: value})
-        except:
-            pass
+    @staticmethod
+    def _update_alpha_state(widget: tk.Widget, property_name: str, value: float):
+        """Simulate alpha by toggling the widget's state."""
+        widget.config(state='disabled' if value < 0.1 else 'normal')
     
-    def _update_alpha(self, widget: tk.Widget, property_name: str, value: float):
-        """Update widget alpha/transparency."""
-        try:
-            # For Canvas widgets, we can simulate alpha by adjusting colors
-            if isinstance(widget, tk.Canvas):
-                # This is a simplified alpha effect
-                pass
-            else:
-                # For other widgets, we can't directly set alpha in tkinter
-                # but we can simulate it by adjusting the widget's state
-                if value < 0.1:
-                    widget.config(state='disabled')
-                else:
-                    widget.config(state='normal')
-        except:
-            pass
-    
-    def _update_position(self, widget: tk.Widget, property_name: str, value: float):
-        """Update widget position for slide animations."""
-        try:
-            # Get current grid info
-            grid_info = widget.grid_info()
-            if not grid_info:
-                return
-                
-            if property_name == 'x_offset':
-                widget.grid(padx=(int(value), 0))
-            elif property_name == 'y_offset':
-                widget.grid(pady=(int(value), 0))
-        except:
-            pass
+    @staticmethod
+    def _update_scale_canvas(widget: tk.Widget, property_name: str, value: float):
+        """Scale Canvas contents (placeholder - limited in tkinter)."""
+        pass
     
-    def _update_scale(self, widget: tk.Widget, property_name: str, value: float):
-        """Update widget scale (simplified)."""
-        try:
-            # For Canvas widgets, we could scale the contents
-            # For other widgets, this is limited in tkinter
-            pass
-        except:
-            pass
+    @staticmethod
+    def _update_noop(widget: tk.Widget, property_name: str, value: float):
+        """No-op for property/widget pairs the probe could not support."""
+        pass
 
 
 class AnimatedButton(tk.Button):
@@ -305,6 +476,20 @@ class AnimatedButton(tk.Button):
         self.original_bg = self.cget('bg')
         self.hover_bg = kwargs.get('hover_bg', '#4a4a6a')
         
+        # Precompute a 32-step color ramp between the resting and hover
+        # backgrounds. The Tcl string round-trip in config(bg=...) is
+        # the dominant per-frame cost, so the update path diffs the
+        # ramp index and only issues a config call when it changes.
+        start = self.winfo_rgb(self.original_bg)
+        end = self.winfo_rgb(self.hover_bg)
+        self._ramp = tuple(
+            '#%02x%02x%02x' % (
+                (start[0] + (end[0] - start[0]) * i // 31) >> 8,
+                (start[1] + (end[1] - start[1]) * i // 31) >> 8,
+                (start[2] + (end[2] - start[2]) * i // 31) >> 8)
+            for i in range(32))
+        self._last_ramp_i = -1
+        
         self.bind('<Enter>', self._on_enter)
         self.bind('<Leave>', self._on_leave)
         self.bind('<Button-1>', self._on_click)
@@ -312,16 +497,14 @@ class AnimatedButton(tk.Button):
     def _on_enter(self, event):
         """Handle mouse enter."""
         self.animation_manager.animate(
-            self, 'bg', self._color_to_rgb(self.original_bg), 
-            self._color_to_rgb(self.hover_bg), 0.2, 'ease_out',
+            self, 'hover', 0.0, 1.0, 0.2, 'ease_out',
             self._update_bg_color
         )
     
     def _on_leave(self, event):
         """Handle mouse leave."""
         self.animation_manager.animate(
-            self, 'bg', self._color_to_rgb(self.hover_bg),
-            self._color_to_rgb(self.original_bg), 0.2, 'ease_out',
+            self, 'hover', 1.0, 0.0, 0.2, 'ease_out',
             self._update_bg_color
         )
     
@@ -329,12 +512,9 @@ class AnimatedButton(tk.Button):
         """Handle button click with animation."""
         self.animation_manager.pulse(self, 0.05, 0.1)
     
-    def _color_to_rgb(self, color: str) -> float:
-        """Convert color to RGB value (simplified)."""
-        # This is a simplified conversion
-        return 0.5
-    
     def _update_bg_color(self, widget, property_name, value):
-        """Update background color."""
-        # This would need proper color interpolation
-        pass
\ No newline at end of file
+        """Apply the precomputed ramp color, only when the step changes."""
+        i = int(value * 31)
+        if i != self._last_ramp_i:
+            self._last_ramp_i = i
+            self.config(bg=self._ramp[i])
\ No newline at end of file
@@ -2,10 +2,11 @@
 
 import numpy as np
 import pyaudio
-import threading
 import time
-from typing import Callable, Optional
 from collections import deque
+from typing import Callable, Optional
+
+from ._audio_kernel import process_chunk, warm_up
 
 
 class AudioLevelMonitor:
@@ -33,10 +34,12 @@ class AudioLevelMonitor:
         self.audio = pyaudio.PyAudio()
         self.stream: Optional[pyaudio.Stream] = None
         self.monitoring = False
-        self.monitor_thread: Optional[threading.Thread] = None
+        self._kernel = process_chunk
         
-        # Level calculation
-        self.level_history = deque(maxlen=10)  # Keep last 10 readings for smoothing
+        # Level smoothing - one-pole IIR lowpass y = a*x + (1-a)*y,
+        # a single multiply-add per chunk with no history buffer
+        self._smooth = 0.0
+        self._alpha = 0.2
         self.current_level = 0.0
         self.peak_level = 0.0
         self.noise_floor = 0.001  # Minimum threshold to ignore background noise
@@ -44,8 +47,19 @@ class AudioLevelMonitor:
         # Voice activity detection
         self.voice_threshold = 0.02  # Threshold for voice activity
         self.is_voice_detected = False
-        self.voice_start_time = None
+        self.voice_start_ns = None
         self.min_voice_duration = 0.1  # Minimum duration to consider as voice
+        self._min_voice_ns = int(self.min_voice_duration * 1_000_000_000)
+        
+        # Last values delivered to the UI, for coalescing in _poll
+        self._last_cb_level = -1.0
+        self._last_cb_voice = False
+        
+        # Bounded error log: a failing device can raise per chunk, and
+        # printing each one grabs the stdio lock at up to 100 Hz
+        self._errlog = deque(maxlen=32)
+        self._err_count = 0
+        self._last_err_print_ns = 0
         
     def start_monitoring(self) -> bool:
         """Start real-time audio level monitoring.
@@ -57,83 +71,102 @@ class AudioLevelMonitor:
             return True
             
         try:
+            # Compile (or fetch) the level kernel before the stream
+            # opens so the first chunk never pays the JIT cost
+            self._kernel = warm_up()
+            
+            # Callback mode: PortAudio delivers each chunk to
+            # _pa_callback from its own thread, so there is no Python
+            # polling loop, no pacing sleep, and no explicit read()
+            self.monitoring = True
+            # int16 halves the bytes moved per chunk vs float32 and
+            # skips PortAudio's int->float conversion; the kernel
+            # normalizes to [0, 1] once per chunk
             self.stream = self.audio.open(
-                format=pyaudio.paFloat32,
+                format=pyaudio.paInt16,
                 channels=self.channels,
                 rate=self.sample_rate,
                 input=True,
                 frames_per_buffer=self.chunk_size,
-                stream_callback=None
+                stream_callback=self._pa_callback
             )
             
-            self.monitoring = True
-            self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-            self.monitor_thread.start()
-            
             return True
             
         except Exception as e:
             print(f"Failed to start audio monitoring: {e}")
+            self.monitoring = False
             return False
     
     def stop_monitoring(self) -> None:
         """Stop audio level monitoring."""
         self.monitoring = False
         
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=1.0)
-            self.monitor_thread = None
-            
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
             self.stream = None
     
-    def _monitor_loop(self) -> None:
-        """Main monitoring loop running in separate thread."""
-        while self.monitoring and self.stream:
-            try:
-                # Read audio data
-                data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-                audio_data = np.frombuffer(data, dtype=np.float32)
-                
-                # Calculate RMS (Root Mean Square) level
-                rms_level = np.sqrt(np.mean(audio_data ** 2))
-                
-                # Apply noise floor
-                if rms_level < self.noise_floor:
-                    rms_level = 0.0
-                
-                # Smooth the level using history
-                self.level_history.append(rms_level)
-                smoothed_level = np.mean(self.level_history)
-                
-                # Normalize to 0-1 range (adjust multiplier as needed)
-                normalized_level = min(1.0, smoothed_level * 50)  # Amplify for visibility
-                
-                # Update current level
-                self.current_level = normalized_level
-                
-                # Update peak level (with decay)
-                if normalized_level > self.peak_level:
-                    self.peak_level = normalized_level
-                else:
-                    self.peak_level *= 0.95  # Peak decay
-                
-                # Voice activity detection
-                self._detect_voice_activity(normalized_level)
-                
-                # Call update callback
-                if self.update_callback:
-                    self.update_callback(normalized_level, self.is_voice_detected)
-                
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)  # 100 FPS update rate
-                
-            except Exception as e:
-                if self.monitoring:  # Only log if we're supposed to be monitoring
-                    print(f"Audio monitoring error: {e}")
-                break
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """Process one chunk; invoked by PortAudio on its own thread."""
+        try:
+            # Zero-copy view over the buffer PortAudio hands us; in
+            # callback mode that pointer is PortAudio's own reused
+            # block, so no per-chunk copy of the samples is made
+            audio_data = np.frombuffer(in_data, dtype=np.int16)
+            
+            # RMS, noise floor, smoothing, normalization, and peak
+            # decay all happen in the compiled kernel - one call per
+            # chunk, no NumPy temporaries
+            (normalized_level, self.peak_level, self._smooth,
+             _) = self._kernel(
+                audio_data, self._smooth, self.peak_level,
+                self.noise_floor, self.voice_threshold, self._alpha)
+            
+            # Update current level
+            self.current_level = normalized_level
+            
+            # Voice activity detection
+            self._detect_voice_activity(normalized_level)
+            
+        except Exception as e:
+            if self.monitoring:  # Only log if we're supposed to be monitoring
+                self._log_error(e)
+        
+        return (None, pyaudio.paContinue)
+    
+    def _log_error(self, exc: Exception) -> None:
+        """Record a callback error, printing a summary at most once per second.
+        
+        Args:
+            exc: The exception raised while processing a chunk
+        """
+        now_ns = time.perf_counter_ns()
+        self._errlog.append((now_ns, repr(exc)))
+        self._err_count += 1
+        if now_ns - self._last_err_print_ns >= 1_000_000_000:
+            self._last_err_print_ns = now_ns
+            print(f"Audio monitoring error ({self._err_count} total): {exc!r}")
+    
+    def _poll(self) -> None:
+        """Push the latest level to the update callback.
+        
+        Called from the Tk after loop (see
+        AnimationManager.register_audio_tick) so all widget work stays
+        on the main thread; the PortAudio callback only records state.
+        Deliveries are coalesced: during silence the level pins at 0.0
+        and repeating it would only burn Tcl round-trips, so the
+        callback fires only when the level or voice flag changed since
+        the last delivery.
+        """
+        if not self.update_callback:
+            return
+        level = self.current_level
+        voice = self.is_voice_detected
+        if level != self._last_cb_level or voice != self._last_cb_voice:
+            self._last_cb_level = level
+            self._last_cb_voice = voice
+            self.update_callback(level, voice)
     
     def _detect_voice_activity(self, level: float) -> None:
         """Detect voice activity based on audio level.
@@ -141,22 +174,22 @@ class AudioLevelMonitor:
         Args:
             level: Current normalized audio level (0-1)
         """
-        current_time = time.time()
+        now_ns = time.perf_counter_ns()
         
         if level > self.voice_threshold:
             if not self.is_voice_detected:
-                self.voice_start_time = current_time
+                self.voice_start_ns = now_ns
             self.is_voice_detected = True
         else:
             if self.is_voice_detected:
                 # Check if voice was detected for minimum duration
-                if (self.voice_start_time and 
-                    current_time - self.voice_start_time < self.min_voice_duration):
+                if (self.voice_start_ns and 
+                    now_ns - self.voice_start_ns < self._min_voice_ns):
                     # Too short to be considered voice
                     pass
                 else:
                     self.is_voice_detected = False
-                    self.voice_start_time = None
+                    self.voice_start_ns = None
     
     def get_current_level(self) -> float:
         """Get current audio level (0-1)."""
@@ -199,16 +232,22 @@ class AudioLevelMonitor:
             return self.noise_floor
             
         print(f"Calibrating noise floor for {duration} seconds...")
+        # Sample into a preallocated array - no list append/boxing - at
+        # 50 Hz for a stabler estimate over the same duration
+        buf = np.empty(int(duration / 0.02) + 1, dtype=np.float32)
+        n = 0
         start_time = time.time()
-        noise_samples = []
         
-        while time.time() - start_time < duration:
-            noise_samples.append(self.current_level)
-            time.sleep(0.1)
+        while time.time() - start_time < duration and n < buf.shape[0]:
+            buf[n] = self.current_level
+            n += 1
+            time.sleep(0.02)
         
-        if noise_samples:
-            # Set noise floor to 95th percentile of measured noise
-            noise_floor = np.percentile(noise_samples, 95)
+        if n:
+            # 95th percentile via introselect - O(n) partition instead
+            # of a full sort
+            k = min(int(n * 0.95), n - 1)
+            noise_floor = float(np.partition(buf[:n], k)[k])
             self.set_noise_floor(noise_floor)
             print(f"Noise floor calibrated to: {noise_floor:.4f}")
             return noise_floor
@@ -0,0 +1,725 @@
+"""Automatic pasting of transcribed text into the focused text field."""
+
+import ctypes
+import os
+import platform
+import queue
+import re
+import subprocess
+import threading
+import time
+
+import pyperclip
+
+# Cached once - platform.system() does a uname round-trip per call
+_SYSTEM = platform.system()
+
+# macOS accessibility API via pyobjc - optional; without it the probe
+# falls back to AppleScript. Direct AX calls avoid spawning osascript
+# (process launch plus script compile, easily 100ms+ per probe).
+try:
+    from ApplicationServices import (
+        AXUIElementCreateSystemWide,
+        AXUIElementCopyAttributeValue,
+        kAXFocusedUIElementAttribute,
+        kAXRoleAttribute,
+    )
+except ImportError:
+    AXUIElementCreateSystemWide = None
+
+# Linux accessibility via AT-SPI - optional; without it the probe uses
+# the X11 window-title heuristic, then xdotool. AT-SPI reports the
+# focused widget's actual role, so text entries in GTK/Qt apps are
+# recognized without title-substring guessing.
+try:
+    import pyatspi
+except ImportError:
+    pyatspi = None
+
+# Window classes that are text inputs (exact match; richedit versions
+# are caught by a startswith fallback) and app-title fragments that
+# indicate an editable target. The title fragments are compiled into
+# one alternation so a probe scans the title once instead of running
+# fifteen substring searches.
+_CLASS_SET = frozenset({
+    'edit', 'richedit', 'richedit20a', 'richedit20w', 'richedit50w',
+    'notepad', 'scintilla', 'consolewindowclass',
+})
+_TEXT_APPS = (
+    'notepad', 'word', 'code', 'sublime', 'atom', 'notepad++',
+    'wordpad', 'teams', 'slack', 'discord', 'telegram', 'whatsapp',
+    'chrome', 'firefox', 'edge', 'terminal',
+)
+_TITLE_RE = re.compile('|'.join(map(re.escape, _TEXT_APPS)))
+
+# Combined macOS fallback: probe the focused role and paste in ONE
+# osascript spawn - each spawn costs 100ms+ on recent macOS
+_MACOS_PROBE_PASTE_SCRIPT = '''
+tell application "System Events"
+    set r to role of focused UI element of (first process whose frontmost is true)
+    if r is "AXTextField" or r is "AXTextArea" then
+        keystroke "v" using command down
+        return "ok"
+    end if
+    return "no"
+end tell
+'''
+
+# Win32 clipboard constants
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+
+# Win32 synthesized-input structures (layout matches the x64 ABI; the
+# union is padded to MOUSEINPUT's size, the largest member)
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+
+# WinEvent hook constants for push-based focus tracking
+_EVENT_OBJECT_FOCUS = 0x8005
+_WINEVENT_OUTOFCONTEXT = 0x0000
+
+
+# Bind Win32 prototypes once: each ctypes.windll.user32.X access does
+# a dynamic attribute lookup and argument-spec inference per call;
+# bound functions with declared argtypes/restype are a direct FFI
+# trampoline
+if _SYSTEM == 'Windows':
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    _GetForegroundWindow = _user32.GetForegroundWindow
+    _GetForegroundWindow.restype = wintypes.HWND
+    _GetForegroundWindow.argtypes = []
+
+    _GetClassNameW = _user32.GetClassNameW
+    _GetClassNameW.restype = ctypes.c_int
+    _GetClassNameW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+
+    _GetWindowTextLengthW = _user32.GetWindowTextLengthW
+    _GetWindowTextLengthW.restype = ctypes.c_int
+    _GetWindowTextLengthW.argtypes = [wintypes.HWND]
+
+    _GetWindowTextW = _user32.GetWindowTextW
+    _GetWindowTextW.restype = ctypes.c_int
+    _GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+
+    _SendInput = _user32.SendInput
+    _SendInput.restype = wintypes.UINT
+    _SendInput.argtypes = [wintypes.UINT, ctypes.c_void_p, ctypes.c_int]
+
+    _OpenClipboard = _user32.OpenClipboard
+    _OpenClipboard.restype = wintypes.BOOL
+    _OpenClipboard.argtypes = [wintypes.HWND]
+
+    _CloseClipboard = _user32.CloseClipboard
+    _CloseClipboard.restype = wintypes.BOOL
+    _CloseClipboard.argtypes = []
+
+    _EmptyClipboard = _user32.EmptyClipboard
+    _EmptyClipboard.restype = wintypes.BOOL
+    _EmptyClipboard.argtypes = []
+
+    _GetClipboardData = _user32.GetClipboardData
+    _GetClipboardData.restype = wintypes.HANDLE
+    _GetClipboardData.argtypes = [wintypes.UINT]
+
+    _SetClipboardData = _user32.SetClipboardData
+    _SetClipboardData.restype = wintypes.HANDLE
+    _SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+
+    _GetClipboardSequenceNumber = _user32.GetClipboardSequenceNumber
+    _GetClipboardSequenceNumber.restype = wintypes.DWORD
+    _GetClipboardSequenceNumber.argtypes = []
+
+    _GlobalAlloc = _kernel32.GlobalAlloc
+    _GlobalAlloc.restype = wintypes.HGLOBAL
+    _GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+
+    _GlobalLock = _kernel32.GlobalLock
+    _GlobalLock.restype = ctypes.c_void_p
+    _GlobalLock.argtypes = [wintypes.HGLOBAL]
+
+    _GlobalUnlock = _kernel32.GlobalUnlock
+    _GlobalUnlock.restype = wintypes.BOOL
+    _GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+
+    _WinEventProc = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+
+    _SetWinEventHook = _user32.SetWinEventHook
+    _SetWinEventHook.restype = wintypes.HANDLE
+    _SetWinEventHook.argtypes = [
+        wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, _WinEventProc,
+        wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+
+    _GetMessageW = _user32.GetMessageW
+    _GetMessageW.restype = wintypes.BOOL
+    _GetMessageW.argtypes = [
+        ctypes.c_void_p, wintypes.HWND, wintypes.UINT, wintypes.UINT]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [('wVk', ctypes.c_ushort),
+                ('wScan', ctypes.c_ushort),
+                ('dwFlags', ctypes.c_uint32),
+                ('time', ctypes.c_uint32),
+                ('dwExtraInfo', ctypes.c_size_t)]
+
+
+class _INPUT(ctypes.Structure):
+    class _U(ctypes.Union):
+        _fields_ = [('ki', _KEYBDINPUT),
+                    ('padding', ctypes.c_byte * 32)]
+
+    _anonymous_ = ('u',)
+    _fields_ = [('type', ctypes.c_uint32),
+                ('u', _U)]
+
+
+class AutoPaste:
+    """Pastes transcribed text into whatever text field has focus.
+
+    After a transcription completes, the text is already on the
+    clipboard; this class checks whether the focused UI element looks
+    like a text input and, if so, synthesizes a paste keystroke so the
+    user never has to press Ctrl+V themselves.
+    """
+
+    def __init__(self, root=None, enabled: bool = True):
+        """Initialize auto-paste support.
+
+        Args:
+            root: Optional Tk root; when given, the pre-paste settle
+                delay runs on its after timer instead of sleeping the
+                worker thread
+            enabled: Whether pasting is active; when False paste_text
+                is a no-op
+        """
+        self.system = _SYSTEM
+        self.enabled = enabled
+        self._root = root
+
+        # macOS: cache the systemwide accessibility element once; each
+        # probe is then two in-process AX calls instead of an osascript
+        # spawn
+        self._ax_system = None
+        if self.system == 'Darwin' and AXUIElementCreateSystemWide is not None:
+            try:
+                self._ax_system = AXUIElementCreateSystemWide()
+            except Exception as e:
+                print(f"Accessibility API unavailable: {e}")
+
+        # Precompile the fallback script once; osascript then skips its
+        # lexer/compile phase on every subsequent invocation
+        self._scpt_path = None
+        if self.system == 'Darwin' and self._ax_system is None:
+            self._compile_probe_script()
+
+        # Linux: open the X display once and look up the Ctrl/V
+        # keycodes once; each paste is then a handful of in-process
+        # XTest calls instead of an xdotool fork+exec
+        self._xdisplay = None
+        self._x11 = None
+        self._xtst = None
+        # AT-SPI focus listener mirrors the Windows WinEvent hook:
+        # focus changes push the widget role into _atspi_role and the
+        # probe becomes a flag read
+        self._atspi_active = False
+        self._atspi_role = None
+        if self.system == 'Linux':
+            self._init_x11()
+            if pyatspi is not None:
+                threading.Thread(
+                    target=self._run_atspi_listener, daemon=True).start()
+
+        # Memoized focus probe: during burst dictation each utterance
+        # would otherwise re-query the OS for the same foreground field
+        self._focus_cache = (0.0, False)
+        self._focus_cache_ttl = 0.5
+
+        # Windows: push-based focus tracking. A WinEvent hook flips
+        # _focus_is_text whenever focus moves, so the paste-time probe
+        # becomes a flag read instead of an OS round-trip. If the hook
+        # fails to install, the pull probe below stays in effect.
+        self._focus_is_text = False
+        self._win_hook = None
+        if self.system == 'Windows':
+            threading.Thread(
+                target=self._run_focus_hook, daemon=True).start()
+
+        # One persistent worker serializes all pastes: no per-call
+        # thread creation, and concurrent pastes can't race the
+        # clipboard save/restore
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run_worker, daemon=True)
+        self._worker.start()
+
+    def _init_x11(self) -> None:
+        """Bind libX11/libXtst and cache display and keycodes."""
+        try:
+            x11 = ctypes.CDLL('libX11.so.6')
+            xtst = ctypes.CDLL('libXtst.so.6')
+        except OSError:
+            return  # fall back to xdotool
+
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XKeysymToKeycode.restype = ctypes.c_ubyte
+        x11.XKeysymToKeycode.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        x11.XGetInputFocus.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_int)]
+        x11.XFetchName.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong,
+            ctypes.POINTER(ctypes.c_char_p)]
+        x11.XFree.argtypes = [ctypes.c_void_p]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        xtst.XTestFakeKeyEvent.argtypes = [
+            ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+
+        display = x11.XOpenDisplay(None)
+        if not display:
+            return
+
+        self._x11 = x11
+        self._xtst = xtst
+        self._xdisplay = display
+        self._kc_ctrl = x11.XKeysymToKeycode(display, 0xFFE3)  # XK_Control_L
+        self._kc_v = x11.XKeysymToKeycode(display, 0x0076)     # XK_v
+
+    def paste_text(self, text: str, delay_ms: int = 100) -> None:
+        """Paste text into the focused field after a short delay.
+
+        Args:
+            text: The text to paste (already on the clipboard)
+            delay_ms: Delay before pasting, letting the UI settle
+        """
+        # isspace instead of strip: same test, no throwaway copy of a
+        # potentially long transcription
+        if not self.enabled or not text or text.isspace():
+            return
+
+        if self._root is not None and delay_ms:
+            # Let Tk's timer absorb the settle delay; the worker only
+            # wakes when there is actual paste work to do
+            self._root.after(delay_ms, lambda: self._queue.put((text, 0)))
+        else:
+            self._queue.put((text, delay_ms))
+
+    def _compile_probe_script(self) -> None:
+        """Compile the combined probe+paste script to a .scpt file."""
+        import tempfile
+
+        try:
+            path = tempfile.NamedTemporaryFile(
+                suffix='.scpt', delete=False).name
+            result = subprocess.run(
+                ['osacompile', '-o', path, '-e', _MACOS_PROBE_PASTE_SCRIPT],
+                capture_output=True, timeout=10)
+            if result.returncode == 0:
+                self._scpt_path = path
+            else:
+                os.unlink(path)
+        except Exception as e:
+            print(f"Script precompile failed: {e}")
+
+    def _run_worker(self) -> None:
+        """Consume queued pastes one at a time."""
+        while True:
+            text, delay_ms = self._queue.get()
+            self._paste_text_async(text, delay_ms)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Enable or disable auto-pasting.
+
+        Args:
+            enabled: New enabled state
+        """
+        self.enabled = enabled
+
+    def _paste_text_async(self, text: str, delay_ms: int) -> None:
+        """Probe the focused element and paste if appropriate."""
+        try:
+            if delay_ms:  # only without a Tk root to defer through
+                time.sleep(delay_ms / 1000)
+
+            if self.system == 'Darwin' and self._ax_system is None:
+                # No accessibility API: fold the focus probe and the
+                # keystroke into a single osascript spawn
+                self._paste_macos_combined(text)
+            elif self._is_text_field_active():
+                self._perform_paste(text)
+        except Exception as e:
+            print(f"Auto-paste error: {e}")
+
+    def _is_text_field_active(self) -> bool:
+        """Check whether the focused UI element accepts text input.
+
+        Results are cached for a short TTL so consecutive pastes in a
+        dictation burst pay for one OS round-trip, not one each.
+        """
+        now = time.monotonic()
+        cached_at, cached_result = self._focus_cache
+        if now - cached_at < self._focus_cache_ttl:
+            return cached_result
+
+        if self.system == 'Windows':
+            result = self._is_windows_text_field_active()
+        elif self.system == 'Darwin':
+            result = self._is_macos_text_field_active()
+        elif self.system == 'Linux':
+            result = self._is_linux_text_field_active()
+        else:
+            result = False
+
+        self._focus_cache = (now, result)
+        return result
+
+    def invalidate_focus_cache(self) -> None:
+        """Drop the cached focus probe (e.g. after an app switch)."""
+        self._focus_cache = (0.0, False)
+
+    def _run_focus_hook(self) -> None:
+        """Install the focus WinEvent hook and pump its messages.
+
+        SetWinEventHook delivers events to the installing thread's
+        message queue, so this thread sits in GetMessageW and the
+        callback runs on it whenever focus moves anywhere on the
+        desktop.
+        """
+        try:
+            # Keep a reference: the hook holds a raw pointer to the
+            # callback thunk, which must not be garbage collected
+            self._win_event_proc = _WinEventProc(self._on_focus_event)
+            self._win_hook = _SetWinEventHook(
+                _EVENT_OBJECT_FOCUS, _EVENT_OBJECT_FOCUS, None,
+                self._win_event_proc, 0, 0, _WINEVENT_OUTOFCONTEXT)
+            if not self._win_hook:
+                return  # pull probe stays in effect
+            msg = ctypes.create_string_buffer(48)  # sizeof(MSG) on x64
+            while _GetMessageW(msg, None, 0, 0) > 0:
+                pass
+        except Exception as e:
+            print(f"Focus hook unavailable: {e}")
+            self._win_hook = None
+
+    def _on_focus_event(self, hook, event, hwnd, id_object, id_child,
+                        thread_id, event_time):
+        """Classify the newly focused window; runs on the hook thread."""
+        try:
+            self._focus_is_text = (bool(hwnd) and
+                                   self._window_accepts_text(hwnd))
+        except Exception:
+            self._focus_is_text = False
+
+    def _is_windows_text_field_active(self) -> bool:
+        """Check whether the focused window accepts text on Windows."""
+        if self._win_hook:
+            # Push path: the hook already classified the window when
+            # focus moved, so this is just a flag read
+            return self._focus_is_text
+        try:
+            hwnd = _GetForegroundWindow()
+            return bool(hwnd) and self._window_accepts_text(hwnd)
+        except Exception as e:
+            print(f"Focus probe failed: {e}")
+            return False
+
+    @staticmethod
+    def _window_accepts_text(hwnd) -> bool:
+        """Classify a window as a text target by class name and title."""
+        class_name = ctypes.create_unicode_buffer(256)
+        _GetClassNameW(hwnd, class_name, 256)
+        class_name_str = class_name.value.lower()
+
+        if (class_name_str in _CLASS_SET or
+                class_name_str.startswith('richedit')):
+            return True
+
+        length = _GetWindowTextLengthW(hwnd)
+        if length:
+            title = ctypes.create_unicode_buffer(length + 1)
+            _GetWindowTextW(hwnd, title, length + 1)
+            if _TITLE_RE.search(title.value.lower()):
+                return True
+
+        return False
+
+    def _is_macos_text_field_active(self) -> bool:
+        """Probe the focused element's AX role on macOS."""
+        if self._ax_system is not None:
+            try:
+                err, focused = AXUIElementCopyAttributeValue(
+                    self._ax_system, kAXFocusedUIElementAttribute, None)
+                if err or focused is None:
+                    return False
+                err, role = AXUIElementCopyAttributeValue(
+                    focused, kAXRoleAttribute, None)
+                if err:
+                    return False
+                return role in ('AXTextField', 'AXTextArea')
+            except Exception as e:
+                print(f"Focus probe failed: {e}")
+                return False
+
+        return self._is_macos_text_field_active_osascript()
+
+    def _is_macos_text_field_active_osascript(self) -> bool:
+        """AppleScript fallback probe for when pyobjc is unavailable."""
+        try:
+            script = (
+                'tell application "System Events" to '
+                'get role of focused UI element of '
+                '(first process whose frontmost is true)'
+            )
+            result = subprocess.run(
+                ['osascript', '-e', script],
+                capture_output=True, text=True, timeout=2)
+            role = result.stdout.strip()
+            return role in ('AXTextField', 'AXTextArea')
+        except Exception as e:
+            print(f"Focus probe failed: {e}")
+            return False
+
+    def _run_atspi_listener(self) -> None:
+        """Register the AT-SPI focus listener and pump its events."""
+        try:
+            pyatspi.Registry.registerEventListener(
+                self._on_atspi_focus, 'object:state-changed:focused')
+            self._atspi_active = True
+            pyatspi.Registry.start()
+        except Exception as e:
+            print(f"AT-SPI unavailable: {e}")
+            self._atspi_active = False
+
+    def _on_atspi_focus(self, event) -> None:
+        """Cache the focused widget's role; runs on the AT-SPI thread."""
+        try:
+            if event.detail1:  # focus gained
+                self._atspi_role = event.source.getRole()
+        except Exception:
+            self._atspi_role = None
+
+    def _is_linux_text_field_active(self) -> bool:
+        """Check whether the focused widget accepts text on Linux."""
+        if self._atspi_active:
+            # Push path: the listener cached the actual widget role
+            # when focus moved - no fork, no title heuristics
+            return self._atspi_role in (
+                pyatspi.ROLE_TEXT, pyatspi.ROLE_ENTRY,
+                pyatspi.ROLE_TERMINAL)
+
+        if self._xdisplay:
+            try:
+                # XGetInputFocus + XFetchName in-process, no fork
+                window = ctypes.c_ulong()
+                revert = ctypes.c_int()
+                self._x11.XGetInputFocus(
+                    self._xdisplay, ctypes.byref(window),
+                    ctypes.byref(revert))
+                if not window.value:
+                    return False
+                name = ctypes.c_char_p()
+                if not self._x11.XFetchName(
+                        self._xdisplay, window.value, ctypes.byref(name)):
+                    return False
+                if not name.value:
+                    return False
+                title = name.value.decode('utf-8', 'replace').lower()
+                self._x11.XFree(name)
+                return _TITLE_RE.search(title) is not None
+            except Exception as e:
+                print(f"Focus probe failed: {e}")
+                return False
+
+        try:
+            result = subprocess.run(
+                ['xdotool', 'getwindowfocus', 'getwindowname'],
+                capture_output=True, text=True, timeout=2)
+            title = result.stdout.strip().lower()
+            return bool(title) and _TITLE_RE.search(title) is not None
+        except Exception as e:
+            print(f"Focus probe failed: {e}")
+            return False
+
+    def _defer(self, fn, delay_ms: int = 100) -> None:
+        """Run fn after the paste keystroke has settled, without blocking.
+
+        With a Tk root the wait rides the event loop's timer and the
+        worker is immediately free for the next queued paste; without
+        one the worker briefly sleeps instead.
+
+        Args:
+            fn: Zero-argument callable to run after the delay
+            delay_ms: How long to let the target app process the paste
+        """
+        if self._root is not None:
+            self._root.after(delay_ms, fn)
+        else:
+            time.sleep(delay_ms / 1000)
+            fn()
+
+    def _perform_paste(self, text: str) -> None:
+        """Dispatch the paste keystroke for the current platform."""
+        if self.system == 'Windows':
+            self._paste_windows(text)
+        elif self.system == 'Darwin':
+            self._paste_macos(text)
+        elif self.system == 'Linux':
+            self._paste_linux(text)
+
+    def _paste_windows(self, text: str) -> None:
+        """Paste on Windows via direct Win32 clipboard calls and Ctrl+V."""
+        try:
+            original_clipboard = self._read_windows_clipboard()
+            # Direct SetClipboardData - synchronous, so no settle sleep
+            # waiting for a clipboard helper to finish
+            self._write_windows_clipboard(text)
+            seq_after_write = _GetClipboardSequenceNumber()
+
+            # One SendInput call delivers the whole Ctrl+V sequence
+            # atomically - no per-key sleeps between keybd_event calls
+            events = ((0x11, 0),                  # Ctrl down
+                      (0x56, 0),                  # V down
+                      (0x56, _KEYEVENTF_KEYUP),   # V up
+                      (0x11, _KEYEVENTF_KEYUP))   # Ctrl up
+            inputs = (_INPUT * len(events))()
+            for inp, (vk, flags) in zip(inputs, events):
+                inp.type = _INPUT_KEYBOARD
+                inp.ki.wVk = vk
+                inp.ki.dwFlags = flags
+            _SendInput(
+                len(events), ctypes.byref(inputs), ctypes.sizeof(_INPUT))
+
+            # Restore only when there is something worth restoring and
+            # no other process has touched the clipboard since our
+            # write - never clobber a copy the user just made. Deferred
+            # so the worker never sleeps waiting for the target app to
+            # consume the paste.
+            if original_clipboard and original_clipboard != text:
+                def _restore():
+                    if _GetClipboardSequenceNumber() == seq_after_write:
+                        self._write_windows_clipboard(original_clipboard)
+                self._defer(_restore)
+        except Exception as e:
+            print(f"Paste failed: {e}")
+
+    @staticmethod
+    def _read_windows_clipboard() -> str:
+        """Read clipboard text with one OpenClipboard transaction."""
+        text = ''
+        if not _OpenClipboard(None):
+            return text
+        try:
+            handle = _GetClipboardData(_CF_UNICODETEXT)
+            if handle:
+                ptr = _GlobalLock(handle)
+                if ptr:
+                    text = ctypes.wstring_at(ptr)
+                    _GlobalUnlock(handle)
+        finally:
+            _CloseClipboard()
+        return text
+
+    @staticmethod
+    def _write_windows_clipboard(text: str) -> None:
+        """Put text on the clipboard with one OpenClipboard transaction."""
+        data = text.encode('utf-16-le') + b'\x00\x00'
+        if not _OpenClipboard(None):
+            return
+        try:
+            _EmptyClipboard()
+            handle = _GlobalAlloc(_GMEM_MOVEABLE, len(data))
+            if handle:
+                ptr = _GlobalLock(handle)
+                ctypes.memmove(ptr, data, len(data))
+                _GlobalUnlock(handle)
+                # The system owns the handle after SetClipboardData
+                _SetClipboardData(_CF_UNICODETEXT, handle)
+        finally:
+            _CloseClipboard()
+
+    def _paste_macos_combined(self, text: str) -> None:
+        """Probe focus and paste with one osascript invocation."""
+        try:
+            # pyperclip.copy is synchronous (the pasteboard helper has
+            # exited by the time it returns), so no settle sleep is
+            # needed before the keystroke
+            original_clipboard = pyperclip.paste()
+            pyperclip.copy(text)
+
+            if self._scpt_path:
+                cmd = ['osascript', self._scpt_path]
+            else:
+                cmd = ['osascript', '-e', _MACOS_PROBE_PASTE_SCRIPT]
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=3)
+            pasted = result.stdout.strip() == 'ok'
+
+            if original_clipboard and original_clipboard != text:
+                if pasted:
+                    self._defer(
+                        lambda: pyperclip.copy(original_clipboard))
+                else:
+                    pyperclip.copy(original_clipboard)
+        except Exception as e:
+            print(f"Paste failed: {e}")
+
+    def __del__(self):
+        """Cleanup when object is destroyed."""
+        if getattr(self, '_scpt_path', None):
+            try:
+                os.unlink(self._scpt_path)
+            except OSError:
+                pass
+
+    def _paste_macos(self, text: str) -> None:
+        """Paste on macOS via the clipboard and a Cmd+V keystroke."""
+        try:
+            original_clipboard = pyperclip.paste()
+            pyperclip.copy(text)
+
+            subprocess.run(
+                ['osascript', '-e',
+                 'tell application "System Events" to keystroke "v" '
+                 'using command down'],
+                capture_output=True, timeout=2)
+
+            # Empty original (or a binary clipboard that reads back as
+            # empty text) means nothing to restore
+            if original_clipboard and original_clipboard != text:
+                self._defer(lambda: pyperclip.copy(original_clipboard))
+        except Exception as e:
+            print(f"Paste failed: {e}")
+
+    def _paste_linux(self, text: str) -> None:
+        """Paste on Linux via the clipboard and a synthesized Ctrl+V."""
+        try:
+            original_clipboard = pyperclip.paste()
+            pyperclip.copy(text)
+
+            if self._xdisplay:
+                # XTest fake key events - sub-millisecond, in-process
+                self._xtst.XTestFakeKeyEvent(
+                    self._xdisplay, self._kc_ctrl, 1, 0)
+                self._xtst.XTestFakeKeyEvent(
+                    self._xdisplay, self._kc_v, 1, 0)
+                self._xtst.XTestFakeKeyEvent(
+                    self._xdisplay, self._kc_v, 0, 0)
+                self._xtst.XTestFakeKeyEvent(
+                    self._xdisplay, self._kc_ctrl, 0, 0)
+                self._x11.XFlush(self._xdisplay)
+            else:
+                subprocess.run(
+                    ['xdotool', 'key', 'ctrl+v'],
+                    capture_output=True, timeout=2)
+
+            # Empty original (or a binary clipboard that reads back as
+            # empty text) means nothing to restore
+            if original_clipboard and original_clipboard != text:
+                self._defer(lambda: pyperclip.copy(original_clipboard))
+        except Exception as e:
+            print(f"Paste failed: {e}")
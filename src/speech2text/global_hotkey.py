@@ -1,5 +1,6 @@
 """Global hotkey management for Speech2Text application."""
 
+import queue
 import threading
 from typing import Callable, Optional
 from pynput import keyboard
@@ -10,13 +11,20 @@ class GlobalHotkeyManager:
     """Manager for global keyboard shortcuts."""
     
     def __init__(self):
-        self.listener: Optional[keyboard.Listener] = None
+        self.listener: Optional[keyboard.GlobalHotKeys] = None
         self.toggle_callback: Optional[Callable] = None
         self.running = False
-        self.ctrl_pressed = False
-        self.win_pressed = False
-        self.last_trigger_time = 0
-        self.debounce_delay = 0.8  # 800ms debounce
+        # Debounce on the monotonic integer clock: immune to wall-time
+        # steps and no float math on the hot chord path
+        self.last_trigger_ns = 0
+        self._debounce_ns = 800_000_000
+        
+        # Single dispatch worker: callbacks run off the pynput thread
+        # without spawning a new thread per trigger
+        self._dispatch_queue: queue.Queue = queue.Queue()
+        self._dispatcher = threading.Thread(
+            target=self._run_dispatcher, daemon=True)
+        self._dispatcher.start()
         
     def register_toggle_hotkey(self, callback: Callable) -> None:
         """Register the Ctrl+Win toggle hotkey.
@@ -36,11 +44,12 @@ class GlobalHotkeyManager:
             return True
             
         try:
-            # Start the listener
-            self.listener = keyboard.Listener(
-                on_press=self._on_key_press,
-                on_release=self._on_key_release
-            )
+            # GlobalHotKeys registers the combo natively: pynput only
+            # calls back on the full chord, so no Python code runs on
+            # every system-wide keystroke
+            self.listener = keyboard.GlobalHotKeys({
+                '<ctrl>+<cmd>': self._fire,
+            })
             
             self.listener.start()
             self.running = True
@@ -58,44 +67,23 @@ class GlobalHotkeyManager:
             self.listener = None
         self.running = False
         
-    def _on_key_press(self, key):
-        """Handle key press events."""
-        try:
-            # Track Ctrl key
-            if key in [keyboard.Key.ctrl_l, keyboard.Key.ctrl_r]:
-                self.ctrl_pressed = True
-                
-            # Track Windows key  
-            if key in [keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r]:
-                self.win_pressed = True
-                
-            # Check if both Ctrl and Win are pressed
-            if self.ctrl_pressed and self.win_pressed:
-                current_time = time.time()
-                if current_time - self.last_trigger_time > self.debounce_delay:
-                    self.last_trigger_time = current_time
-                    if self.toggle_callback:
-                        print("Hotkey Ctrl+Win detected!")
-                        # Execute callback in separate thread
-                        thread = threading.Thread(target=self.toggle_callback, daemon=True)
-                        thread.start()
-                    
-        except Exception as e:
-            print(f"Error in key press handler: {e}")
+    def _fire(self):
+        """Handle a completed hotkey chord with debouncing."""
+        now_ns = time.monotonic_ns()
+        if now_ns - self.last_trigger_ns > self._debounce_ns:
+            self.last_trigger_ns = now_ns
+            if self.toggle_callback:
+                print("Hotkey Ctrl+Win detected!")
+                self._dispatch_queue.put(self.toggle_callback)
     
-    def _on_key_release(self, key):
-        """Handle key release events."""
-        try:
-            # Track Ctrl key release
-            if key in [keyboard.Key.ctrl_l, keyboard.Key.ctrl_r]:
-                self.ctrl_pressed = False
-                
-            # Track Windows key release
-            if key in [keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r]:
-                self.win_pressed = False
-                
-        except Exception as e:
-            print(f"Error in key release handler: {e}")
+    def _run_dispatcher(self):
+        """Run queued hotkey callbacks off the pynput thread."""
+        while True:
+            callback = self._dispatch_queue.get()
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in hotkey callback: {e}")
     
     def __del__(self):
         """Cleanup when object is destroyed."""
@@ -2,34 +2,11 @@
 
 import sys
 import os
+import platform
 import tkinter as tk
 
-
-# Add current directory to path for PyInstaller
-if getattr(sys, 'frozen', False):
-    # Running as PyInstaller executable
-    current_dir = os.path.dirname(sys.executable)
-    sys.path.insert(0, current_dir)
-
-# Try multiple import strategies
-try:
-    # Try relative import first (normal development)
-    from .modern_speech_app import ModernSpeechToTextApp
-except ImportError:
-    try:
-        # Try direct import (PyInstaller)
-        import modern_speech_app
-        ModernSpeechToTextApp = modern_speech_app.ModernSpeechToTextApp
-    except ImportError:
-        try:
-            # Try with speech2text prefix
-            from speech2text.modern_speech_app import ModernSpeechToTextApp
-        except ImportError:
-            # Last resort - set up path manually
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            sys.path.insert(0, current_dir)
-            import modern_speech_app
-            ModernSpeechToTextApp = modern_speech_app.ModernSpeechToTextApp
+# Cached once - platform.system() does a uname round-trip per call
+_SYSTEM = platform.system()
 
 
 def main() -> None:
@@ -40,6 +17,23 @@ def main() -> None:
         # Apply dark title bar immediately after root creation
         _apply_dark_title_bar(root)
         
+        # Paint a minimal window before importing the app module and
+        # its heavy transitive dependencies (audio stack, OpenAI
+        # client) so first paint is pure-Tk init time
+        loading = tk.Label(root, text="Loading…")
+        loading.pack(expand=True)
+        root.update_idletasks()
+        
+        # Resolve the import mode once: a frozen bundle imports the
+        # module top-level from the executable's directory, a source
+        # checkout imports it relative to the package
+        if getattr(sys, 'frozen', False):
+            sys.path.insert(0, os.path.dirname(sys.executable))
+            from modern_speech_app import ModernSpeechToTextApp
+        else:
+            from .modern_speech_app import ModernSpeechToTextApp
+        
+        loading.destroy()
         app = ModernSpeechToTextApp(root)
         root.mainloop()
     except KeyboardInterrupt:
@@ -52,8 +46,7 @@ def main() -> None:
 
 def _apply_dark_title_bar(root: tk.Tk) -> None:
     """Apply dark title bar using pywinstyles library."""
-    import platform
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         try:
             import pywinstyles
             pywinstyles.apply_style(root, "dark")
@@ -21,9 +21,16 @@ except ImportError:
     PYWINSTYLES_AVAILABLE = False
 from .theme import DarkTheme, ModernComponents, AudioLevelMeter, StatusIndicator, ActivityHistoryPanel
 from .audio_monitor import AudioLevelMonitor
+from .auto_paste import AutoPaste
 from .global_hotkey import GlobalHotkeyManager
 from .animations import AnimationManager
 
+# Combobox choice sets for the embedded settings panel - shared tuples
+# instead of list literals rebuilt each time the panel is created
+_SAMPLE_RATE_CHOICES = ("44100 Hz (CD quality)", "22050 Hz",
+                        "16000 Hz (Good for speech)")
+_THEME_CHOICES = ("Dark (Current)", "Light (Coming Soon)")
+
 
 class ModernSpeechToTextApp:
     """Modern Speech2Text application with dark theme and real-time audio visualization."""
@@ -45,6 +52,7 @@ class ModernSpeechToTextApp:
         
         # Audio components
         self.audio_monitor: Optional[AudioLevelMonitor] = None
+        self.auto_paste = AutoPaste(root)
         self.recording_stream = None
         
         # Global hotkey manager
@@ -315,8 +323,10 @@ class ModernSpeechToTextApp:
             update_callback=self._on_audio_level_update
         )
         
-        # Start monitoring
+        # Start monitoring; UI updates are delivered from the Tk
+        # after loop rather than the audio thread
         if self.audio_monitor.start_monitoring():
+            self.animation_manager.register_audio_tick(self.audio_monitor)
             self.footer_label.config(text="Modern Speech2Text v0.1.0")
         else:
             self.footer_label.config(text="Audio monitoring failed • Modern Speech2Text v0.1.0")
@@ -577,6 +587,9 @@ class ModernSpeechToTextApp:
         except Exception as e:
             print(f"Failed to copy to clipboard: {e}")
         
+        # Paste into the focused text field, if any
+        self.auto_paste.paste_text(text)
+        
         # Log activity
         if self.activity_history:
             self.activity_history.add_activity(text)
@@ -1151,7 +1164,7 @@ class EmbeddedSettingsPanel(tk.Frame):
         rate_combo = ttk.Combobox(
             audio_frame,
             textvariable=self.sample_rate_var,
-            values=["44100 Hz (CD quality)", "22050 Hz", "16000 Hz (Good for speech)"],
+            values=_SAMPLE_RATE_CHOICES,
             state='readonly',
             width=30,
             style='Modern.TCombobox'
@@ -1204,7 +1217,7 @@ class EmbeddedSettingsPanel(tk.Frame):
         theme_combo = ttk.Combobox(
             theme_frame,
             textvariable=self.theme_var,
-            values=["Dark (Current)", "Light (Coming Soon)"],
+            values=_THEME_CHOICES,
             state='readonly',
             width=30,
             style='Modern.TCombobox'
@@ -6,14 +6,46 @@ API key management, audio parameters, and output preferences.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk
 from typing import Optional, Callable
-from .settings import settings
+
+# messagebox, filedialog, and the settings store are imported lazily in
+# the handlers that use them - they stay out of the import graph (and
+# out of frozen-app startup) until the Settings dialog is actually used
+
+
+# Combobox choice sets - tuples shared across dialog opens instead of
+# fresh list literals allocated on every _create_*_tab call
+_SAMPLE_RATES = ("8000", "16000", "22050", "44100", "48000")
+_CHANNEL_CHOICES = ("1 (Mono)", "2 (Stereo)")
+_CHUNK_SIZES = ("512", "1024", "2048", "4096")
+_FILE_FORMATS = ("txt", "md", "rtf")
+_THEMES = ("Default", "Dark (Coming Soon)")
+_GEOMETRIES = ("600x500", "800x600", "1000x700", "1200x800")
+
+# Multi-line informational texts - module constants so the builders
+# bind existing strings instead of re-concatenating them. (The short
+# style and option literals are already interned by CPython.)
+_API_INFO_TEXT = (
+    "Your OpenAI API key is encrypted and stored securely on your device.\n"
+    "Get your API key from: https://platform.openai.com/api-keys")
+_QUALITY_INFO_TEXT = (
+    "Higher sample rates provide better quality but larger file sizes.\n"
+    "44100 Hz is CD quality and recommended for most users.\n"
+    "Mono (1 channel) is sufficient for speech recognition.")
+_RESET_CONFIRM_TEXT = (
+    "Are you sure you want to reset all settings to defaults?\n"
+    "This action cannot be undone.")
 
 
 class SettingsDialog:
     """Settings configuration dialog window."""
-    
+
+    # Fixed dialog size - known up front, so centering never needs to
+    # ask Tk how big the window came out
+    DIALOG_WIDTH = 500
+    DIALOG_HEIGHT = 600
+
     def __init__(self, parent: tk.Tk, on_settings_changed: Optional[Callable] = None):
         self.parent = parent
         self.on_settings_changed = on_settings_changed
@@ -21,85 +53,132 @@ class SettingsDialog:
         
         # Temporary settings storage
         self.temp_settings = {}
+
+        # Tk variables are allocated once here and bound by the tab
+        # builders. Each Var registers a named Tcl variable that lives
+        # until interpreter shutdown, so per-build allocation would
+        # leak names across rebuild cycles.
+        self.api_key_var = tk.StringVar(master=parent)
+        self.show_key_var = tk.BooleanVar(master=parent)
+        self.sample_rate_var = tk.StringVar(master=parent)
+        self.channels_var = tk.StringVar(master=parent)
+        self.channels_value = tk.IntVar(master=parent, value=1)
+        self.chunk_size_var = tk.StringVar(master=parent)
+        self.auto_save_var = tk.BooleanVar(master=parent)
+        self.save_dir_var = tk.StringVar(master=parent)
+        self.file_format_var = tk.StringVar(master=parent)
+        self.theme_var = tk.StringVar(master=parent)
+        self.theme_value = tk.StringVar(master=parent, value="default")
+        self.geometry_var = tk.StringVar(master=parent)
         
     def show(self) -> None:
         """Display the settings dialog."""
         if self.dialog and self.dialog.winfo_exists():
-            self.dialog.focus()
+            # Reuse the widget tree from the first open: re-center,
+            # refresh the values, and put the modal grab back. Skipping
+            # the rebuild avoids both the widget-creation cost and the
+            # Tcl objects a destroyed tree leaves behind.
+            self._center_dialog()
+            self.dialog.deiconify()
+            self._load_current_settings()
+            self.dialog.grab_set()
+            self.dialog.focus_set()
             return
-        
+
         self._create_dialog()
         self._load_current_settings()
+
+        # Acquire the modal grab last, once the cheap work is done
+        self.dialog.grab_set()
         
     def _create_dialog(self) -> None:
         """Create the settings dialog window."""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Settings - Speech2Text")
-        self.dialog.geometry("500x600")
-        self.dialog.resizable(True, True)
-        
-        # Make dialog modal
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
-        
-        # Center dialog on parent
+
+        # Toplevels are resizable by default, so no resizable() call is
+        # needed - one fewer synchronous wm round-trip during open
         self._center_dialog()
-        
-        # Create notebook for tabbed interface
-        notebook = ttk.Notebook(self.dialog)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Create tabs
-        self._create_api_tab(notebook)
-        self._create_audio_tab(notebook)
-        self._create_output_tab(notebook)
-        self._create_ui_tab(notebook)
+
+        # Keep the dialog on top of its parent and give it focus. The
+        # modal grab is deferred to show() - grab_set synchronously
+        # round-trips to the window manager, so it should not bracket
+        # the settings-load path
+        self.dialog.transient(self.parent)
+        self.dialog.focus_set()
+
+        # Tab strip + frame swapper instead of ttk.Notebook - the same
+        # pattern the embedded settings panel uses. The Notebook widget
+        # manages panes and reflows everything on each switch; here a
+        # switch is one grid_remove plus one grid call, and the bare
+        # tab frames stay lazy (built and loaded on first view).
+        self._active_tab = tk.IntVar(master=self.dialog, value=0)
+        tab_bar = ttk.Frame(self.dialog)
+        tab_bar.pack(fill=tk.X, padx=10, pady=(10, 0))
+        self._tab_host = ttk.Frame(self.dialog)
+        self._tab_host.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._tab_host.columnconfigure(0, weight=1)
+        self._tab_host.rowconfigure(0, weight=1)
+
+        self._tab_frames = {}
+        for index, title in enumerate(
+                ("API Configuration", "Audio Settings",
+                 "Output Settings", "Interface")):
+            ttk.Radiobutton(
+                tab_bar, text=title, value=index,
+                variable=self._active_tab, style='Toolbutton',
+                command=self._on_tab_changed).pack(side=tk.LEFT)
+            self._tab_frames[index] = ttk.Frame(self._tab_host)
+        self._tab_builders = {
+            0: self._create_api_tab,
+            1: self._create_audio_tab,
+            2: self._create_output_tab,
+            3: self._create_ui_tab,
+        }
+        self._tab_loaders = {
+            0: self._load_api_settings,
+            1: self._load_audio_settings,
+            2: self._load_output_settings,
+            3: self._load_ui_settings,
+        }
+        self._built_tabs: set[int] = set()
+        self._loaded_tabs: set[int] = set()
+        # Show the default tab's (still empty) frame; its widgets are
+        # built by the settings load that follows in show()
+        self._tab_frames[0].grid(row=0, column=0, sticky='nsew')
         
         # Create button frame
         self._create_button_frame()
         
         # Handle dialog close
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
-        
+
     def _center_dialog(self) -> None:
-        """Center the dialog on the parent window."""
-        self.dialog.update_idletasks()
-        
-        # Get parent position and size
-        parent_x = self.parent.winfo_x()
-        parent_y = self.parent.winfo_y()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
-        
-        # Get dialog size
-        dialog_width = self.dialog.winfo_width()
-        dialog_height = self.dialog.winfo_height()
-        
-        # Calculate center position
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        
-        self.dialog.geometry(f"+{x}+{y}")
-        
-    def _create_api_tab(self, notebook: ttk.Notebook) -> None:
-        """Create the API configuration tab."""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="API Configuration")
-        
+        """Size and center the dialog over its parent in one geometry call.
+
+        The dialog size is a class constant, so there is no need to
+        force a synchronous layout pass (update_idletasks) just to read
+        the window size back from the server.
+        """
+        x = self.parent.winfo_rootx() + (self.parent.winfo_width() - self.DIALOG_WIDTH) // 2
+        y = self.parent.winfo_rooty() + (self.parent.winfo_height() - self.DIALOG_HEIGHT) // 2
+        self.dialog.geometry(f"{self.DIALOG_WIDTH}x{self.DIALOG_HEIGHT}+{x}+{y}")
+
+
+    def _create_api_tab(self, frame: ttk.Frame) -> None:
+        """Build the API configuration tab's widgets."""
         # API Key section
         api_frame = ttk.LabelFrame(frame, text="OpenAI API Settings", padding=10)
         api_frame.pack(fill=tk.X, padx=10, pady=10)
         
         ttk.Label(api_frame, text="API Key:").grid(row=0, column=0, sticky=tk.W, pady=5)
         
-        self.api_key_var = tk.StringVar()
         self.api_key_entry = ttk.Entry(api_frame, textvariable=self.api_key_var, 
                                       show="*", width=50)
         self.api_key_entry.grid(row=0, column=1, columnspan=2, sticky=(tk.W, tk.E), 
                                padx=(10, 0), pady=5)
         
         # Show/Hide API key button
-        self.show_key_var = tk.BooleanVar()
         ttk.Checkbutton(api_frame, text="Show API Key", variable=self.show_key_var,
                        command=self._toggle_api_key_visibility).grid(row=1, column=1, 
                                                                     sticky=tk.W, pady=5)
@@ -109,44 +188,38 @@ class SettingsDialog:
                   command=self._test_api_key).grid(row=1, column=2, sticky=tk.E, pady=5)
         
         # API Key info
-        info_text = ("Your OpenAI API key is encrypted and stored securely on your device.\n"
-                    "Get your API key from: https://platform.openai.com/api-keys")
-        info_label = ttk.Label(api_frame, text=info_text, wraplength=450, 
+        info_label = ttk.Label(api_frame, text=_API_INFO_TEXT, wraplength=450,
                               foreground="gray")
         info_label.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
         
         api_frame.columnconfigure(1, weight=1)
         
-    def _create_audio_tab(self, notebook: ttk.Notebook) -> None:
-        """Create the audio configuration tab."""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Audio Settings")
-        
+    def _create_audio_tab(self, frame: ttk.Frame) -> None:
+        """Build the audio configuration tab's widgets."""
         # Audio recording settings
         audio_frame = ttk.LabelFrame(frame, text="Recording Settings", padding=10)
         audio_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Sample rate
         ttk.Label(audio_frame, text="Sample Rate (Hz):").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.sample_rate_var = tk.StringVar()
         sample_rate_combo = ttk.Combobox(audio_frame, textvariable=self.sample_rate_var,
-                                        values=["8000", "16000", "22050", "44100", "48000"],
+                                        values=_SAMPLE_RATES,
                                         state="readonly", width=20)
         sample_rate_combo.grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=5)
         
-        # Channels
+        # Channels - the display string is paired with an IntVar holding
+        # the semantic value, so saving never parses the label text
         ttk.Label(audio_frame, text="Channels:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.channels_var = tk.StringVar()
         channels_combo = ttk.Combobox(audio_frame, textvariable=self.channels_var,
-                                     values=["1 (Mono)", "2 (Stereo)"],
+                                     values=_CHANNEL_CHOICES,
                                      state="readonly", width=20)
         channels_combo.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=5)
+        channels_combo.bind('<<ComboboxSelected>>', self._on_channels_selected)
         
         # Chunk size
         ttk.Label(audio_frame, text="Buffer Size:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.chunk_size_var = tk.StringVar()
         chunk_combo = ttk.Combobox(audio_frame, textvariable=self.chunk_size_var,
-                                  values=["512", "1024", "2048", "4096"],
+                                  values=_CHUNK_SIZES,
                                   state="readonly", width=20)
         chunk_combo.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=5)
         
@@ -154,30 +227,22 @@ class SettingsDialog:
         quality_frame = ttk.LabelFrame(frame, text="Quality Information", padding=10)
         quality_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        quality_text = ("Higher sample rates provide better quality but larger file sizes.\n"
-                       "44100 Hz is CD quality and recommended for most users.\n"
-                       "Mono (1 channel) is sufficient for speech recognition.")
-        ttk.Label(quality_frame, text=quality_text, wraplength=450,
+        ttk.Label(quality_frame, text=_QUALITY_INFO_TEXT, wraplength=450,
                  foreground="gray").pack(anchor=tk.W)
         
-    def _create_output_tab(self, notebook: ttk.Notebook) -> None:
-        """Create the output configuration tab."""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Output Settings")
-        
+    def _create_output_tab(self, frame: ttk.Frame) -> None:
+        """Build the output configuration tab's widgets."""
         # File output settings
         output_frame = ttk.LabelFrame(frame, text="File Output", padding=10)
         output_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Auto-save option
-        self.auto_save_var = tk.BooleanVar()
         ttk.Checkbutton(output_frame, text="Auto-save transcriptions",
                        variable=self.auto_save_var).grid(row=0, column=0, columnspan=3,
                                                          sticky=tk.W, pady=5)
         
         # Save directory
         ttk.Label(output_frame, text="Save Directory:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.save_dir_var = tk.StringVar()
         ttk.Entry(output_frame, textvariable=self.save_dir_var,
                  width=40, state="readonly").grid(row=1, column=1, sticky=(tk.W, tk.E),
                                                  padx=(10, 5), pady=5)
@@ -186,36 +251,31 @@ class SettingsDialog:
         
         # File format
         ttk.Label(output_frame, text="File Format:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.file_format_var = tk.StringVar()
         format_combo = ttk.Combobox(output_frame, textvariable=self.file_format_var,
-                                   values=["txt", "md", "rtf"],
+                                   values=_FILE_FORMATS,
                                    state="readonly", width=20)
         format_combo.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=5)
         
         output_frame.columnconfigure(1, weight=1)
         
-    def _create_ui_tab(self, notebook: ttk.Notebook) -> None:
-        """Create the UI configuration tab."""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Interface")
-        
+    def _create_ui_tab(self, frame: ttk.Frame) -> None:
+        """Build the UI configuration tab's widgets."""
         # UI settings
         ui_frame = ttk.LabelFrame(frame, text="Interface Settings", padding=10)
         ui_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Theme selection (placeholder for future implementation)
         ttk.Label(ui_frame, text="Theme:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.theme_var = tk.StringVar()
         theme_combo = ttk.Combobox(ui_frame, textvariable=self.theme_var,
-                                  values=["Default", "Dark (Coming Soon)"],
+                                  values=_THEMES,
                                   state="readonly", width=20)
         theme_combo.grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=5)
+        theme_combo.bind('<<ComboboxSelected>>', self._on_theme_selected)
         
         # Window geometry
         ttk.Label(ui_frame, text="Window Size:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.geometry_var = tk.StringVar()
         geometry_combo = ttk.Combobox(ui_frame, textvariable=self.geometry_var,
-                                     values=["600x500", "800x600", "1000x700", "1200x800"],
+                                     values=_GEOMETRIES,
                                      state="readonly", width=20)
         geometry_combo.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=5)
         
@@ -245,28 +305,104 @@ class SettingsDialog:
                   command=self._on_ok).pack(side=tk.RIGHT, padx=(5, 0))
         
     def _load_current_settings(self) -> None:
-        """Load current settings into the dialog controls."""
-        # API settings
-        self.api_key_var.set(settings.get_api_key())
-        
-        # Audio settings
+        """Load settings for the currently visible tab, deferring the rest.
+
+        Other tabs build and load on first view via the tab bar; the
+        save path force-loads anything still pending so unseen tabs
+        round-trip their stored values unchanged.
+        """
+        self._loaded_tabs.clear()
+        self._load_tab(self._active_tab.get())
+
+    def _on_tab_changed(self) -> None:
+        """Swap in the newly selected tab's frame."""
+        index = self._active_tab.get()
+        self._load_tab(index)
+        for i, frame in self._tab_frames.items():
+            if i != index:
+                frame.grid_remove()
+        self._tab_frames[index].grid(row=0, column=0, sticky='nsew')
+
+    def _load_tab(self, index: int) -> None:
+        """Build the given tab's widgets and load its settings, once each."""
+        builder = self._tab_builders.get(index)
+        if builder and index not in self._built_tabs:
+            self._built_tabs.add(index)
+            builder(self._tab_frames[index])
+        loader = self._tab_loaders.get(index)
+        if loader and index not in self._loaded_tabs:
+            self._loaded_tabs.add(index)
+            loader()
+
+    def _ensure_all_tabs_loaded(self) -> None:
+        """Force-build and load every pending tab (used before saving)."""
+        for index in self._tab_loaders:
+            self._load_tab(index)
+
+    @staticmethod
+    def _set_if_changed(var, value) -> None:
+        """Write a Tk variable only when the value actually differs.
+
+        Every var.set is a Python-to-Tcl round-trip that also fires
+        any attached traces, so reloads skip writes that would be
+        no-ops - the common case when reopening the dialog without
+        having changed anything.
+        """
+        if var.get() != value:
+            var.set(value)
+
+    def _load_api_settings(self) -> None:
+        """Load API settings into the dialog controls."""
+        from .settings import settings
+
+        self._set_if_changed(self.api_key_var, settings.get_api_key())
+
+    def _load_audio_settings(self) -> None:
+        """Load audio settings into the dialog controls."""
+        from .settings import settings
+
         audio_settings = settings.get_audio_settings()
-        self.sample_rate_var.set(str(audio_settings.get("sample_rate", 44100)))
+        self._set_if_changed(self.sample_rate_var,
+                             str(audio_settings.get("sample_rate", 44100)))
         channels = audio_settings.get("channels", 1)
-        self.channels_var.set(f"{channels} ({'Mono' if channels == 1 else 'Stereo'})")
-        self.chunk_size_var.set(str(audio_settings.get("chunk_size", 1024)))
-        
-        # Output settings
+        self._set_if_changed(
+            self.channels_var,
+            f"{channels} ({'Mono' if channels == 1 else 'Stereo'})")
+        self._set_if_changed(self.channels_value, channels)
+        self._set_if_changed(self.chunk_size_var,
+                             str(audio_settings.get("chunk_size", 1024)))
+
+    def _load_output_settings(self) -> None:
+        """Load output settings into the dialog controls."""
+        from .settings import settings
+
         output_settings = settings.get_output_settings()
-        self.auto_save_var.set(output_settings.get("auto_save", False))
-        self.save_dir_var.set(output_settings.get("save_directory", ""))
-        self.file_format_var.set(output_settings.get("file_format", "txt"))
-        
-        # UI settings
+        self._set_if_changed(self.auto_save_var,
+                             output_settings.get("auto_save", False))
+        self._set_if_changed(self.save_dir_var,
+                             output_settings.get("save_directory", ""))
+        self._set_if_changed(self.file_format_var,
+                             output_settings.get("file_format", "txt"))
+
+    def _load_ui_settings(self) -> None:
+        """Load UI settings into the dialog controls."""
+        from .settings import settings
+
         ui_settings = settings.get_ui_settings()
-        self.theme_var.set(ui_settings.get("theme", "Default").title())
-        self.geometry_var.set(ui_settings.get("window_geometry", "600x500"))
-        
+        theme = ui_settings.get("theme", "Default")
+        self._set_if_changed(self.theme_var, theme.title())
+        self._set_if_changed(self.theme_value, theme.lower())
+        self._set_if_changed(self.geometry_var,
+                             ui_settings.get("window_geometry", "600x500"))
+        
+    def _on_channels_selected(self, event) -> None:
+        """Mirror the channel display choice into its semantic IntVar."""
+        self.channels_value.set(1 if 'Mono' in self.channels_var.get() else 2)
+
+    def _on_theme_selected(self, event) -> None:
+        """Mirror the theme display choice into its stored form."""
+        self.theme_value.set(self.theme_var.get().lower())
+
     def _toggle_api_key_visibility(self) -> None:
         """Toggle API key visibility in the entry field."""
         if self.show_key_var.get():
@@ -276,13 +412,19 @@ class SettingsDialog:
             
     def _test_api_key(self) -> None:
         """Test the API key validity."""
+        from tkinter import messagebox
+
+        from .settings import settings
+
         api_key = self.api_key_var.get().strip()
         
         if not api_key:
             messagebox.showwarning("API Key Test", "Please enter an API key first.")
             return
-            
-        if not settings.validate_api_key(api_key):
+
+        # Cheap prefix check first - rejects the common bad paste without
+        # touching the settings module's full validation
+        if not api_key.startswith('sk-') or not settings.validate_api_key(api_key):
             messagebox.showerror("API Key Test", 
                                "Invalid API key format. Keys should start with 'sk-'.")
             return
@@ -293,6 +435,8 @@ class SettingsDialog:
         
     def _browse_save_directory(self) -> None:
         """Browse for save directory."""
+        from tkinter import filedialog
+
         directory = filedialog.askdirectory(
             title="Select Save Directory",
             initialdir=self.save_dir_var.get()
@@ -302,6 +446,10 @@ class SettingsDialog:
             
     def _export_settings(self) -> None:
         """Export settings to file."""
+        from tkinter import filedialog, messagebox
+
+        from .settings import settings
+
         file_path = filedialog.asksaveasfilename(
             title="Export Settings",
             defaultextension=".json",
@@ -316,6 +464,10 @@ class SettingsDialog:
                 
     def _import_settings(self) -> None:
         """Import settings from file."""
+        from tkinter import filedialog, messagebox
+
+        from .settings import settings
+
         file_path = filedialog.askopenfilename(
             title="Import Settings",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
@@ -330,19 +482,30 @@ class SettingsDialog:
                 
     def _reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
-        if messagebox.askyesno("Reset Settings", 
-                             "Are you sure you want to reset all settings to defaults?\n"
-                             "This action cannot be undone."):
+        from tkinter import messagebox
+
+        from .settings import settings
+
+        if messagebox.askyesno("Reset Settings", _RESET_CONFIRM_TEXT):
             settings.reset_to_defaults()
             self._load_current_settings()
             messagebox.showinfo("Reset Settings", "Settings reset to defaults.")
             
     def _save_settings(self) -> bool:
         """Save current dialog settings."""
+        from tkinter import messagebox
+
+        from .settings import settings
+
+        # Tabs never shown still hold empty vars - load them first so
+        # saving writes back their stored values, not blanks
+        self._ensure_all_tabs_loaded()
+
         try:
             # Save API key
             api_key = self.api_key_var.get().strip()
-            if api_key and not settings.validate_api_key(api_key):
+            if api_key and (not api_key.startswith('sk-')
+                            or not settings.validate_api_key(api_key)):
                 messagebox.showerror("Invalid API Key", 
                                    "API key format is invalid. Keys should start with 'sk-'.")
                 return False
@@ -350,9 +513,7 @@ class SettingsDialog:
             
             # Save audio settings
             settings.set("audio.sample_rate", int(self.sample_rate_var.get()))
-            channels_text = self.channels_var.get()
-            channels = 1 if "Mono" in channels_text else 2
-            settings.set("audio.channels", channels)
+            settings.set("audio.channels", self.channels_value.get())
             settings.set("audio.chunk_size", int(self.chunk_size_var.get()))
             
             # Save output settings
@@ -361,7 +522,7 @@ class SettingsDialog:
             settings.set("output.file_format", self.file_format_var.get())
             
             # Save UI settings
-            settings.set("ui.theme", self.theme_var.get().lower())
+            settings.set("ui.theme", self.theme_value.get())
             settings.set("ui.window_geometry", self.geometry_var.get())
             
             # Persist settings
@@ -380,6 +541,8 @@ class SettingsDialog:
         
     def _on_apply(self) -> None:
         """Handle Apply button click."""
+        from tkinter import messagebox
+
         if self._save_settings():
             if self.on_settings_changed:
                 self.on_settings_changed()
@@ -390,7 +553,13 @@ class SettingsDialog:
         self._close_dialog()
         
     def _close_dialog(self) -> None:
-        """Close the settings dialog."""
-        if self.dialog:
+        """Hide the settings dialog, keeping its widget tree for reuse."""
+        if self.dialog and self.dialog.winfo_exists():
+            self.dialog.grab_release()
+            self.dialog.withdraw()
+
+    def destroy(self) -> None:
+        """Tear the dialog down for real (called at application exit)."""
+        if self.dialog and self.dialog.winfo_exists():
             self.dialog.destroy()
-            self.dialog = None
\ No newline at end of file
+        self.dialog = None
\ No newline at end of file
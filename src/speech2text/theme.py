@@ -58,22 +58,34 @@ class DarkTheme:
         'code': ('Consolas', 9),
     }
     
+    # Set once by ensure_styles_initialized - ttk style maps live in the
+    # interpreter, so registering them again is pure redundant Tcl work
+    _styles_initialized = False
+
     @classmethod
     def apply_theme(cls, root: tk.Tk) -> None:
         """Apply the dark theme to the application."""
         # Configure root window
         root.configure(bg=cls.COLORS['bg_primary'])
-        
-        # Create and configure ttk style
+        cls.ensure_styles_initialized()
+
+    @classmethod
+    def ensure_styles_initialized(cls) -> None:
+        """Register all ttk styles exactly once per interpreter.
+
+        Widget factories and dialogs reference styles by name only;
+        this is the single place the style maps are configured, so
+        calling it from multiple construction paths is safe and cheap.
+        """
+        if cls._styles_initialized:
+            return
+        cls._styles_initialized = True
+
         style = ttk.Style()
-        
-        # Configure the theme
         style.theme_use('clam')  # Use clam as base theme
-        
-        # Configure ttk styles
         cls._configure_ttk_styles(style)
-        
-    
+
+
     @classmethod
     def _configure_ttk_styles(cls, style: ttk.Style) -> None:
         """Configure all ttk widget styles."""